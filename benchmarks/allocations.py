@@ -0,0 +1,74 @@
+"""Allocations per round with and without pooled hands.
+
+Each measured round is played with the previous round's hands pinned, so
+anything the round allocates and keeps shows up as a new block in a
+tracemalloc snapshot diff instead of reusing freed memory. Only blocks
+allocated from the simulator's own modules are counted.
+
+Usage: python -m benchmarks.allocations [--rounds N] [--players N]
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+from src.game.blackjack import Game
+from src.game.player import Player
+from src.strategies import BasicStrategy
+from src.utils.sinks import NullSink
+
+SOURCE_FILTER = tracemalloc.Filter(True, os.path.join('*', 'src', '*'))
+
+
+def build_game(num_players, pooled, seed=0):
+    players = [Player(f"Player {i + 1}", 10 ** 9, BasicStrategy()) for i in range(num_players)]
+    return Game(players, minimum_bet=10, seed=seed, sink=NullSink(), pooled=pooled)
+
+
+def measure_allocations(num_players, pooled, num_rounds):
+    """Returns (blocks allocated per round, peak bytes per round) under tracemalloc."""
+    game = build_game(num_players, pooled)
+    game.run_simulation(100)  # Warm up caches and the pools
+
+    tracemalloc.start()
+    blocks = 0
+    peak = 0
+    for _ in range(num_rounds):
+        pinned = (game.dealer.hand, [player.hands for player in game.players])
+        before = tracemalloc.take_snapshot().filter_traces([SOURCE_FILTER])
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        game.start_game()
+        peak += tracemalloc.get_traced_memory()[1] - current
+        after = tracemalloc.take_snapshot().filter_traces([SOURCE_FILTER])
+        blocks += sum(max(stat.count_diff, 0) for stat in after.compare_to(before, 'lineno'))
+        del pinned
+    tracemalloc.stop()
+    return blocks / num_rounds, peak / num_rounds
+
+
+def measure_throughput(num_players, pooled, num_rounds):
+    """Returns rounds per second without tracing."""
+    game = build_game(num_players, pooled)
+    start = time.perf_counter()
+    game.run_simulation(num_rounds)
+    return num_rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per-round allocations with and without pooled hands.')
+    parser.add_argument('--rounds', type=int, default=200, help='Rounds measured under tracemalloc')
+    parser.add_argument('--players', type=int, default=3, help='Players at the table')
+    parser.add_argument('--throughput-rounds', type=int, default=50_000, help='Rounds timed without tracing')
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'blocks/round':>14}{'peak bytes/round':>18}{'rounds/sec':>14}")
+    for pooled in (False, True):
+        blocks, peak = measure_allocations(args.players, pooled, args.rounds)
+        rate = measure_throughput(args.players, pooled, args.throughput_rounds)
+        mode = 'pooled' if pooled else 'default'
+        print(f"{mode:<10}{blocks:>14.1f}{peak:>18.0f}{rate:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Startup budget check for the simulation entry point.
+
+Imports each target in a fresh interpreter under ``python -X importtime``
+and checks that the simulation core never loads the reporting libraries
+and that each target's total import time stays within the budget. Short
+runs and pool workers pay this on every start, so it is tracked
+separately from the throughput benchmarks (which also record it, see
+``benchmarks.suite``).
+
+Usage:
+    python -m benchmarks.startup                  # check against the default budget
+    python -m benchmarks.startup --budget-ms 250  # tighter budget
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed to write reports; none of the targets may import them
+HEAVY_MODULES = ('pandas', 'matplotlib', 'pyarrow', 'openpyxl')
+# Import statements run at startup by a worker process, the core packages and the CLI
+TARGETS = {
+    'game': 'import src.game',
+    'strategies': 'import src.strategies',
+    'analysis': 'import src.analysis',
+    'cli': 'import argparse, yaml, src.analysis, src.game.blackjack, src.game.checkpoint',
+}
+DEFAULT_BUDGET_MS = 400
+
+
+def import_profile(statement, repeat=3):
+    """Returns ``(milliseconds, modules)`` for ``statement`` run in a fresh interpreter.
+
+    The time is the best of ``repeat`` runs of the summed self times
+    reported by ``-X importtime``; ``modules`` are the top-level packages
+    that got imported.
+    """
+    best = float('inf')
+    modules = set()
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', statement],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        total_us = 0
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, _, name = line[len('import time:'):].split('|')
+            total_us += int(self_us)
+            modules.add(name.strip().split('.')[0])
+        best = min(best, total_us / 1000)
+    return best, modules
+
+
+def check_startup(budget_ms=DEFAULT_BUDGET_MS, repeat=3):
+    """Profiles every target and returns ``(timings, problems)``."""
+    timings = {}
+    problems = []
+    for name, statement in TARGETS.items():
+        elapsed_ms, modules = import_profile(statement, repeat=repeat)
+        timings[name] = elapsed_ms
+        heavy = sorted(modules.intersection(HEAVY_MODULES))
+        if heavy:
+            problems.append(f"{name}: imports {', '.join(heavy)}")
+        if elapsed_ms > budget_ms:
+            problems.append(f"{name}: {elapsed_ms:.1f}ms exceeds the {budget_ms}ms budget")
+    return timings, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the import time of the simulation entry point.')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Largest allowed import time per target (default: {DEFAULT_BUDGET_MS}ms)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per target; the best is kept')
+    args = parser.parse_args()
+
+    timings, problems = check_startup(args.budget_ms, args.repeat)
+    for name, elapsed_ms in timings.items():
+        print(f"{name:<12}{elapsed_ms:>8.1f} ms  ({TARGETS[name]})")
+    if problems:
+        print(f"\n{len(problems)} startup problem(s):")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print(f"\nAll targets within {args.budget_ms:g}ms and free of {', '.join(HEAVY_MODULES)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""Benchmark suite for the simulation hot paths, with regression tracking.
+
+Measures Game.run_simulation throughput for every strategy and player
+count, micro-benchmarks the deck, hand, round recording and export paths,
+the peak memory of a recorded run scaled to a million rounds, and the
+import time of the entry points (see ``benchmarks.startup``). Results
+are written as JSON and compared against a stored baseline; any metric
+worse than the baseline by more than the threshold fails the run.
+
+Usage:
+    python -m benchmarks.suite                      # run and compare with benchmarks/baseline.json
+    python -m benchmarks.suite --update-baseline    # run and store the results as the new baseline
+    python -m benchmarks.suite --quick              # fewer rounds, for a smoke test
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from src.analysis import BlackjackAnalytics
+from src.game.blackjack import Game
+from src.game.deck import Deck
+from src.game.hand import Hand
+from src.game.player import Player
+from src.strategies import (
+    AggressiveStrategy, BasicStrategy, CardCountingStrategy, ConservativeStrategy, OptimalStrategy,
+)
+from src.utils.decorators import round_info_decorator
+from src.utils.sinks import ColumnarSink, InMemorySink, NullSink
+
+from .startup import TARGETS, import_profile
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baseline.json')
+RESULTS_PATH = os.path.join(BENCHMARK_DIR, 'results', 'latest.json')
+DEFAULT_THRESHOLD = 0.2
+
+STRATEGIES = {
+    'basic': BasicStrategy,
+    'aggressive': AggressiveStrategy,
+    'conservative': ConservativeStrategy,
+    'optimal': OptimalStrategy,
+    'card_counting': CardCountingStrategy,
+}
+PLAYER_COUNTS = (1, 3, 5)
+
+
+def build_game(strategy_class, num_players, sink=None, seed=0):
+    # Budgets large enough that no player runs out mid-benchmark
+    players = [Player(f"Player {i + 1}", 10 ** 12, strategy_class()) for i in range(num_players)]
+    return Game(players, seed=seed, sink=sink if sink is not None else NullSink())
+
+
+def metric(value, unit, higher_is_better=True):
+    return {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+
+
+def bench_throughput(num_rounds, repeat=3):
+    """Best-of-``repeat`` rounds per second of Game.run_simulation for every strategy and player count."""
+    results = {}
+    for name, strategy_class in STRATEGIES.items():
+        for num_players in PLAYER_COUNTS:
+            game = build_game(strategy_class, num_players)
+            game.run_simulation(min(num_rounds, 1000))  # Warm up tables and caches
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                game.run_simulation(num_rounds)
+                best = min(best, time.perf_counter() - start)
+            results[f"throughput.{name}.{num_players}p"] = metric(num_rounds / best, 'rounds/s')
+    return results
+
+
+def best_of(statement, number, repeat=5, setup='pass'):
+    """Returns the best time per call of ``statement`` in nanoseconds."""
+    return min(timeit.repeat(statement, setup=setup, number=number, repeat=repeat)) / number * 1e9
+
+
+def bench_micro(num_rounds):
+    """Time per call of the deck, hand, recording and export hot paths."""
+    results = {}
+
+    deck = Deck(6, seed=0)
+    results['micro.deck_reset'] = metric(best_of(deck.reset, 200), 'ns/call', higher_is_better=False)
+    # Deal from a fresh shoe each repeat so no reshuffle lands inside the timing
+    results['micro.deck_deal_card'] = metric(
+        best_of(deck.deal_card, deck.cards_remaining(), repeat=100, setup=deck.reset), 'ns/call', higher_is_better=False
+    )
+
+    hand = Hand()
+    for card in (0, 48):  # 2 and Ace of Hearts
+        hand.add_card(card)
+    results['micro.hand_get_value'] = metric(best_of(hand.get_value, 1_000_000), 'ns/call', higher_is_better=False)
+
+    # round_info_decorator on its own: wrap a no-op round and record into an InMemorySink
+    game = build_game(BasicStrategy, 3, sink=InMemorySink())
+    game.run_simulation(10)
+    recorded_round = round_info_decorator(lambda self: None)
+    results['micro.round_info_decorator'] = metric(
+        best_of(lambda: recorded_round(game), 10_000), 'ns/call', higher_is_better=False
+    )
+
+    game = build_game(BasicStrategy, 3, sink=ColumnarSink())
+    game.run_simulation(num_rounds)
+    analytics = BlackjackAnalytics(game)
+    with tempfile.TemporaryDirectory() as output_dir:
+        # Warm-up export, so the timed one doesn't include the lazy pyarrow import
+        analytics.export_results(os.path.join(output_dir, 'warmup'))
+        start = time.perf_counter()
+        analytics.export_results(os.path.join(output_dir, 'round_info'))
+        elapsed = time.perf_counter() - start
+    results['micro.export_results'] = metric(elapsed / num_rounds * 1e9, 'ns/round', higher_is_better=False)
+    return results
+
+
+def bench_memory(num_rounds):
+    """Peak traced memory of a recorded three-player run, scaled to a million rounds."""
+    game = build_game(BasicStrategy, 3, sink=ColumnarSink())
+    tracemalloc.start()
+    game.run_simulation(num_rounds)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'memory.columnar_peak_per_million_rounds': metric(
+        peak / num_rounds * 1_000_000 / 2 ** 20, 'MiB', higher_is_better=False
+    )}
+
+
+def bench_startup(repeat=3):
+    """Best-of-``repeat`` import time of each startup target, in fresh interpreters."""
+    return {
+        f"startup.{name}": metric(import_profile(statement, repeat=repeat)[0], 'ms', higher_is_better=False)
+        for name, statement in TARGETS.items()
+    }
+
+
+def run_suite(quick=False):
+    """Runs every benchmark and returns the results document."""
+    throughput_rounds, micro_rounds, memory_rounds = (
+        (2_000, 2_000, 5_000) if quick else (10_000, 20_000, 50_000)
+    )
+    metrics = {}
+    metrics.update(bench_throughput(throughput_rounds))
+    metrics.update(bench_micro(micro_rounds))
+    metrics.update(bench_memory(memory_rounds))
+    metrics.update(bench_startup())
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'metrics': metrics,
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Returns ``(name, baseline, current, change)`` for every metric worse than the baseline by more than ``threshold``."""
+    regressions = []
+    for name, current in results['metrics'].items():
+        previous = baseline['metrics'].get(name)
+        if previous is None or not previous['value']:
+            continue
+        change = current['value'] / previous['value'] - 1
+        worse = -change if current['higher_is_better'] else change
+        if worse > threshold:
+            regressions.append((name, previous['value'], current['value'], change))
+    return regressions
+
+
+def write_json(document, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the simulation benchmarks and check them against a baseline.')
+    parser.add_argument('--quick', action='store_true', help='Run fewer rounds')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline JSON to compare against')
+    parser.add_argument('--output', default=RESULTS_PATH, help='Where to write the results JSON')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed relative slowdown before a metric fails (default: 0.2)')
+    parser.add_argument('--update-baseline', action='store_true', help='Store the results as the new baseline')
+    args = parser.parse_args()
+
+    results = run_suite(quick=args.quick)
+    write_json(results, args.output)
+    for name, entry in results['metrics'].items():
+        print(f"{name:<45}{entry['value']:>14.1f} {entry['unit']}")
+
+    if args.update_baseline:
+        write_json(results, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}:")
+        for name, previous, current, change in regressions:
+            print(f"  {name}: {previous:.1f} -> {current:.1f} ({change:+.1%})")
+        sys.exit(1)
+    print(f"\nAll metrics within {args.threshold:.0%} of the baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -27,6 +27,7 @@ setup(
         "numpy>=1.21.0",
         "matplotlib>=3.4.0",
         "openpyxl>=3.0.0",
+        "pyarrow>=7.0.0",
     ],
     extras_require={
         'dev': [
@@ -1 +1,2 @@
 from .statistics import BlackjackAnalytics
+from .stopping import StoppingRule
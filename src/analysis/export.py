@@ -0,0 +1,63 @@
+import os
+
+from ..utils.sinks import TABLE_SCHEMAS
+
+FILE_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather', 'arrow': '.arrow'}
+
+
+def _arrow_schema(pa, schema):
+    types = {
+        'int8': pa.int8(),
+        'int32': pa.int32(),
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'bool': pa.bool_(),
+        'str': pa.string(),
+    }
+    return pa.schema([(name, types[dtype]) for name, dtype in schema.items()])
+
+
+def write_tables(chunks, output_dir, format='parquet'):
+    """Streams flat table chunks into one Parquet or Arrow IPC file per table.
+
+    ``chunks`` yields ``{table: {column: array}}`` as produced by a record
+    sink's ``iter_tables()``; each chunk is appended as a row group (Parquet)
+    or record batch (Arrow/Feather), so only one chunk is in memory at a
+    time. Returns the written file paths by table name.
+    """
+    if format not in FILE_EXTENSIONS:
+        raise ValueError(f"Unknown export format: {format}")
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet and Arrow export require pyarrow: pip install pyarrow") from e
+
+    os.makedirs(output_dir, exist_ok=True)
+    schemas = {table: _arrow_schema(pa, schema) for table, schema in TABLE_SCHEMAS.items()}
+    paths = {
+        table: os.path.join(output_dir, table + FILE_EXTENSIONS[format])
+        for table in TABLE_SCHEMAS
+    }
+
+    writers = {}
+    try:
+        for table, schema in schemas.items():
+            if format == 'parquet':
+                writers[table] = pq.ParquetWriter(paths[table], schema)
+            else:
+                writers[table] = pa.ipc.new_file(paths[table], schema)
+
+        for chunk in chunks:
+            for table, columns in chunk.items():
+                schema = schemas[table]
+                arrow_table = pa.table(
+                    [pa.array(columns[field.name], type=field.type) for field in schema],
+                    schema=schema
+                )
+                writers[table].write_table(arrow_table)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    return paths
@@ -1,10 +1,44 @@
-import pandas as pd
-import matplotlib.pyplot as plt
 import os
+from ..utils.aggregation import PlayerAggregate
+from .export import write_tables
+
+
+def write_summary_report(summary, output_dir):
+    """Writes a summary dictionary to ``summary_report.txt`` in ``output_dir``."""
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, 'summary_report.txt'), 'w') as f:
+        f.write("Blackjack Simulation Summary\n")
+        f.write("===========================\n\n")
+        f.write(f"Total Rounds: {summary['total_rounds']}\n\n")
+        
+        for player in summary['players']:
+            f.write(f"Player: {player['name']}\n")
+            if 'final_budget' in player:
+                f.write(f"Final Budget: ${player['final_budget']}\n")
+            if 'net_result' in player:
+                f.write(f"Net Result: ${player['net_result']}\n")
+            f.write(f"Total Hands: {player['total_hands']}\n")
+            f.write(f"Wins: {player['wins']} ({player['wins']/player['total_hands']*100:.1f}%)\n")
+            f.write(f"Losses: {player['losses']} ({player['losses']/player['total_hands']*100:.1f}%)\n")
+            f.write(f"Pushes: {player['pushes']} ({player['pushes']/player['total_hands']*100:.1f}%)\n")
+            f.write(f"Blackjacks: {player['blackjacks']}\n\n")
+
 
 class BlackjackAnalytics:
     def __init__(self, game):
         self.game = game
+
+    @property
+    def sink(self):
+        """The record sink the game was played with."""
+        return self.game.record_sink
+
+    @property
+    def aggregator(self):
+        """Running per-player statistics collected during the simulation."""
+        if self.sink.aggregator is None:
+            raise ValueError(f"{type(self.sink).__name__} does not keep statistics")
+        return self.sink.aggregator
         
     def analyze_win_rate(self):
         """Analyzes win rate and returns statistics."""
@@ -12,12 +46,12 @@ class BlackjackAnalytics:
         
     def plot_budget_history(self, output_dir):
         """Plots budget history for each player."""
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(12, 6))
         
         for player in self.game.players:
-            budgets = [p['budget'] for round_info in self.game.round_info_list 
-                      for p in round_info['players'] if p['name'] == player.name]
-            plt.plot(budgets, label=player.name)
+            plt.plot(self.aggregator.player(player.name).budget_history, label=player.name)
             
         plt.title('Player Budget History')
         plt.xlabel('Round')
@@ -34,104 +68,119 @@ class BlackjackAnalytics:
         
     def generate_summary_report(self, output_dir):
         """Generates a summary report of the simulation."""
+        write_summary_report(self.summarize(), output_dir)
+
+    def enable_variance_reduction(self):
+        """Starts feeding every played round to variance-reduced estimators; call before running."""
+        from ..utils.variance import VarianceEstimators
+
+        if self.aggregator.estimators is None:
+            self.aggregator.estimators = VarianceEstimators(self.game)
+        return self.aggregator.estimators
+
+    def variance_reduction(self):
+        """Returns the variance-reduced estimates of each player's net result per round."""
+        if self.aggregator.estimators is None:
+            raise ValueError("Variance reduction was not enabled before the simulation")
+        return self.aggregator.estimators.summary()
+
+    def generate_variance_report(self, output_dir):
+        """Writes the variance-reduced estimates to ``variance_report.txt`` and returns the text."""
+        if self.aggregator.estimators is None:
+            raise ValueError("Variance reduction was not enabled before the simulation")
+        report = self.aggregator.estimators.report()
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, 'variance_report.txt'), 'w') as f:
+            f.write(report + "\n")
+        return report
+
+    def summarize(self):
+        """Returns per-player result counts for the simulation."""
         summary = {
-            'total_rounds': len(self.game.round_info_list),
+            'total_rounds': self.sink.rounds,
             'players': []
         }
         
         for player in self.game.players:
-            player_stats = {
+            aggregate = self.aggregator.player(player.name)
+            summary['players'].append({
                 'name': player.name,
                 'final_budget': player.budget,
-                'total_hands': 0,
-                'wins': 0,
-                'losses': 0,
-                'pushes': 0,
-                'blackjacks': 0
-            }
-            
-            for round_info in self.game.round_info_list:
-                for p in round_info['players']:
-                    if p['name'] == player.name:
-                        for hand in p['hands']:
-                            player_stats['total_hands'] += 1
-                            if hand['result'] == 'win':
-                                player_stats['wins'] += 1
-                                if hand['is blackjack']:
-                                    player_stats['blackjacks'] += 1
-                            elif hand['result'] == 'lose':
-                                player_stats['losses'] += 1
-                            else:
-                                player_stats['pushes'] += 1
-                                
-            summary['players'].append(player_stats)
+                'total_hands': aggregate.total_hands,
+                'wins': aggregate.wins,
+                'losses': aggregate.losses,
+                'pushes': aggregate.pushes,
+                'blackjacks': aggregate.blackjacks
+            })
             
-        # Write summary to file
-        with open(os.path.join(output_dir, 'summary_report.txt'), 'w') as f:
-            f.write("Blackjack Simulation Summary\n")
-            f.write("===========================\n\n")
-            f.write(f"Total Rounds: {summary['total_rounds']}\n\n")
-            
-            for player in summary['players']:
-                f.write(f"Player: {player['name']}\n")
-                f.write(f"Final Budget: ${player['final_budget']}\n")
-                f.write(f"Total Hands: {player['total_hands']}\n")
-                f.write(f"Wins: {player['wins']} ({player['wins']/player['total_hands']*100:.1f}%)\n")
-                f.write(f"Losses: {player['losses']} ({player['losses']/player['total_hands']*100:.1f}%)\n")
-                f.write(f"Pushes: {player['pushes']} ({player['pushes']/player['total_hands']*100:.1f}%)\n")
-                f.write(f"Blackjacks: {player['blackjacks']}\n\n")
-
-    def get_strategy_statistics(self):
-        """Calculate comprehensive statistics for a strategy."""
-        game_data = self.game.round_info_list
-        player_data = [p for game in game_data for p in game['players']]
-        
-        total_hands = sum(len(p['hands']) for p in player_data)
-        wins = sum(sum(1 for h in p['hands'] if h['result'] == 'win') for p in player_data)
-        blackjacks = sum(sum(1 for h in p['hands'] if h['is blackjack']) for p in player_data)
-        busts = sum(sum(1 for h in p['hands'] if h['is bust']) for p in player_data)
+        return summary
+
+    def get_strategy_statistics(self, player_name=None):
+        """Calculate comprehensive statistics for one player, or all players combined."""
+        players = [p for p in self.game.players if player_name in (None, p.name)]
+        if not players:
+            raise ValueError(f"Unknown player: {player_name}")
         
-        # Calculate consecutive wins
-        max_consecutive_wins = 0
-        current_consecutive_wins = 0
-        for p in player_data:
-            if any(h['result'] == 'win' for h in p['hands']):
-                current_consecutive_wins += 1
-                max_consecutive_wins = max(max_consecutive_wins, current_consecutive_wins)
-            else:
-                current_consecutive_wins = 0
+        combined = PlayerAggregate()
+        for player in players:
+            combined.merge(self.aggregator.player(player.name))
+        total_hands = combined.total_hands
         
         return {
-            'Final Budget': player_data[-1]['budget'],
+            'Final Budget': players[-1].budget,
             'Total Hands': total_hands,
-            'Win Rate': wins / total_hands if total_hands > 0 else 0,
-            'Average Bet': sum(h['bet'] for p in player_data for h in p['hands']) / total_hands,
-            'Largest Win': max((h['bet'] for p in player_data for h in p['hands'] if h['result'] == 'win'), default=0),
-            'Largest Loss': max((h['bet'] for p in player_data for h in p['hands'] if h['result'] == 'lose'), default=0),
-            'Blackjacks': blackjacks,
-            'Busts': busts,
-            'Max Consecutive Wins': max_consecutive_wins
+            'Win Rate': combined.wins / total_hands if total_hands > 0 else 0,
+            'Average Bet': combined.bet_sum / total_hands if total_hands > 0 else 0,
+            'Largest Win': combined.largest_win,
+            'Largest Loss': combined.largest_loss,
+            'Blackjacks': combined.blackjacks,
+            'Busts': combined.busts,
+            'Max Consecutive Wins': combined.max_win_streak,
+            'Mean Net Result': combined.net_mean,
+            'Net Result Std': combined.net_variance ** 0.5
         }
 
-    def run_simulation(self, num_rounds):
-        """Runs simulation and collects statistics."""
-        return self.game.run_simulation(num_rounds)
+    def run_simulation(self, num_rounds, stopping=None):
+        """Runs simulation and collects statistics.
+
+        With a ``StoppingRule``, rounds are played in batches until the rule
+        is satisfied, with ``num_rounds`` as the upper bound; the summary
+        then says why the run stopped under ``stopped_by``.
+        """
+        if stopping is None:
+            return self.game.run_simulation(num_rounds)
         
-    def export_results(self, filename='round_info.xlsx'):
-        """Exports detailed round data to Excel."""
-        df_player = pd.json_normalize(
-            self.game.round_info_list, 
-            ['players', 'hands'], 
-            max_level=3,
-            meta=['round number', ['players', 'name'], ['players', 'budget']]
-        )
+        if self.sink.aggregator is None:
+            raise ValueError(f"Adaptive runs need running statistics, which {type(self.sink).__name__} does not keep")
+        played = 0
+        reason = None
+        while played < num_rounds and not self.game.game_over:
+            batch = min(stopping.batch_rounds, num_rounds - played)
+            self.game.run_simulation(batch, rounds_before=played, total_rounds=num_rounds)
+            played += batch
+            reason = stopping.check(self.game)
+            if reason:
+                break
+        summary = self.game.summarize_round_info_list()
+        summary['stopped_by'] = reason or 'max rounds'
+        return summary
         
-        df_dealer = pd.json_normalize(self.game.round_info_list)
-        df_dealer.drop(['players'], axis=1, inplace=True)
+    def export_results(self, output_dir, format='parquet'):
+        """Exports the round, player and hand tables as Parquet or Arrow IPC files.
+
+        The tables are streamed from the record sink chunk by chunk; returns
+        the written file paths by table name.
+        """
+        return write_tables(self.sink.iter_tables(), output_dir, format=format)
+
+    def export_summary_excel(self, filename='summary.xlsx'):
+        """Exports the per-player summary to an Excel sheet."""
+        import pandas as pd
         
-        df = df_player.merge(df_dealer, on='round number', how='left')
-        df = df.rename(columns=lambda x: x.split('.')[-1])
+        summary = self.summarize()
+        df = pd.DataFrame(summary['players'])
+        df.insert(1, 'total_rounds', summary['total_rounds'])
         
         # Create output directory if needed
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        df.to_excel(filename, index=False) 
\ No newline at end of file
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        df.to_excel(filename, index=False)
@@ -0,0 +1,85 @@
+from statistics import NormalDist
+
+
+def _z(confidence):
+    """Two-sided normal critical value for ``confidence``."""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+class StoppingRule:
+    """Decides when an adaptive simulation has played enough rounds.
+
+    After every batch of ``batch_rounds`` rounds the rule looks at each
+    player's running mean and variance of net result per round played.
+    It stops once at least ``min_rounds`` rounds have been played and
+    either every active player's expected-value confidence interval is
+    narrower than ``ci_half_width`` either side of its mean, or the
+    difference between the two players in ``compare`` (by default the
+    first two players) is significant at level ``significance``. Players
+    who sat out a whole batch, e.g. because their strategy stopped
+    betting, no longer hold the run open.
+
+    The significance test is repeated after every batch, which inflates
+    its false positive rate; pick a smaller ``significance`` than for a
+    single fixed-length comparison.
+    """
+
+    def __init__(self, ci_half_width=None, confidence=0.95, significance=None,
+                 compare=None, min_rounds=1000, batch_rounds=1000):
+        if ci_half_width is None and significance is None:
+            raise ValueError("An adaptive run needs a ci_half_width, a significance level, or both")
+        self.ci_half_width = ci_half_width
+        self.confidence = confidence
+        self.significance = significance
+        self.compare = compare
+        self.min_rounds = min_rounds
+        self.batch_rounds = batch_rounds
+        self._rounds_played = {}
+
+    @classmethod
+    def from_config(cls, adaptive):
+        """Builds a rule from the ``simulation.adaptive`` config section."""
+        return cls(**adaptive)
+
+    def half_width(self, aggregate):
+        """Returns the confidence interval half-width of ``aggregate``'s mean net result per round."""
+        if aggregate.rounds_played < 2:
+            return float('inf')
+        return _z(self.confidence) * (aggregate.round_net_variance / aggregate.rounds_played) ** 0.5
+
+    def z_score(self, first, second):
+        """Returns Welch's z statistic for the difference of two aggregates' mean net result per round."""
+        if first.rounds_played < 2 or second.rounds_played < 2:
+            return 0.0
+        variance = (first.round_net_variance / first.rounds_played
+                    + second.round_net_variance / second.rounds_played)
+        if not variance:
+            return 0.0
+        return (first.round_net_mean - second.round_net_mean) / variance ** 0.5
+
+    def check(self, game):
+        """Returns why the simulation should stop now, or None to keep going."""
+        if game.record_sink.rounds < self.min_rounds:
+            return None
+        aggregator = game.record_sink.aggregator
+        aggregates = {player.name: aggregator.player(player.name) for player in game.players}
+
+        active = [
+            name for name, aggregate in aggregates.items()
+            if aggregate.rounds_played != self._rounds_played.get(name)
+        ]
+        self._rounds_played = {name: aggregate.rounds_played for name, aggregate in aggregates.items()}
+        if not active:
+            return 'no active players'
+
+        if self.significance is not None and len(aggregates) > 1:
+            first, second = self.compare or list(aggregates)[:2]
+            z = self.z_score(aggregates[first], aggregates[second])
+            if abs(z) > _z(1 - self.significance):
+                return f"{first} vs {second} significant (z={z:.2f})"
+
+        if self.ci_half_width is not None and all(
+            self.half_width(aggregates[name]) <= self.ci_half_width for name in active
+        ):
+            return f"confidence intervals within ±{self.ci_half_width}"
+        return None
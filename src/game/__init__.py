@@ -1,6 +1,27 @@
+from importlib import import_module
+
 from .blackjack import Game
 from .player import Player
 from .dealer import Dealer
 from .deck import Deck
 from .card import Card
-from .hand import Hand 
\ No newline at end of file
+from .hand import Hand
+from .observers import RoundObserver, VerbosePrinter
+
+# Imported on first access: these load the strategy package and EV solver,
+# which the game loop itself doesn't need.
+_LAZY_EXPORTS = {
+    'VectorizedSimulator': '.vectorized',
+    'DealerOdds': '.dealer_odds',
+}
+
+__all__ = ['Game', 'Player', 'Dealer', 'Deck', 'Card', 'Hand', 'RoundObserver', 'VerbosePrinter',
+           *_LAZY_EXPORTS]
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,24 +1,85 @@
+import numpy as np
+
 from .deck import Deck
+from .observers import VerbosePrinter
 from .player import Player
 from .dealer import Dealer
 from ..utils.decorators import round_info_decorator
+from ..utils.sinks import InMemorySink, NullSink, create_sink
+from ..utils.instrumentation import instrument, uninstrument
+from .checkpoint import save_checkpoint
+
+MAX_DECISIONS_PER_HAND = 5  # Should be the maximum ever needed
+STRATEGY_NAMES = (
+    'BasicStrategy', 'AggressiveStrategy', 'ConservativeStrategy', 'OptimalStrategy', 'CardCountingStrategy',
+)
 
 
 class Game:
     """Main game controller class."""
     
-    def __init__(self, players, verbose=False, minimum_bet=10):
+    def __init__(self, players, verbose=False, minimum_bet=10, num_decks=6, seed=None, sink=None,
+                 counting_system='hi-lo', pooled=False, replay_shoes=None, first_shoe=0,
+                 antithetic=False):
         self.minimum_bet = minimum_bet
-        self.deck = Deck()
+        self.deck = Deck(num_decks, seed=seed, counting_system=counting_system,
+                         replay_shoes=replay_shoes, first_shoe=first_shoe, antithetic=antithetic)
         self.players = players
-        self.dealer = Dealer()
+        self.dealer = Dealer(pooled=pooled)
         self.round_number = 0
-        self.round_info_list = []
+        self.record_sink = sink if sink is not None else InMemorySink()
         self.verbose = verbose
         self.game_over = False
+        self.stats = None  # GameStats while instrumentation is enabled
+        self.checkpoint_path = None
+        self.checkpoint_every = 0  # Rounds between checkpoints during run_simulation, 0 for none
+        self.outcome_cache = None  # OutcomeCache answering rounds, see enable_outcome_cache()
+        self.observers = [VerbosePrinter()] if verbose else []
         
         for player in self.players:
             player.game = self
+            if pooled:
+                player.use_hand_pool()
+
+    @property
+    def round_info_list(self):
+        """Nested per-round records; only available with an InMemorySink."""
+        return self.record_sink.round_info_list
+            
+    def add_observer(self, observer):
+        """Registers a RoundObserver; the game then plays through the observed executor."""
+        self.observers.append(observer)
+        
+    def remove_observer(self, observer):
+        """Unregisters a RoundObserver."""
+        self.observers.remove(observer)
+        
+    def enable_instrumentation(self):
+        """Starts collecting phase timings, counters and decide() latencies.
+
+        Returns the GameStats being filled in, also available as ``stats``;
+        stats already collected, e.g. before a checkpoint, keep accumulating.
+        """
+        return instrument(self, stats=self.stats)
+        
+    def disable_instrumentation(self):
+        """Removes the instrumentation wrappers; ``stats`` keeps what was collected."""
+        uninstrument(self)
+        
+    def enable_outcome_cache(self, cache=None):
+        """Plays rounds through an OutcomeCache, a new one unless ``cache`` is given, and returns it.
+
+        Only strategies whose decisions depend on nothing but the hand, the
+        up card and whether a double is affordable can be cached; a
+        ValueError is raised for any other.
+        """
+        from .outcome_cache import OutcomeCache
+        
+        for player in self.players:
+            if not player.strategy.cacheable:
+                raise ValueError(f"{player.strategy.name} depends on game state and can't be cached")
+        self.outcome_cache = cache if cache is not None else OutcomeCache()
+        return self.outcome_cache
             
     @round_info_decorator
     def start_game(self):
@@ -28,18 +89,34 @@ class Game:
         self._check_deck()
         self._place_bets()
         self._deal_initial_cards()
-        self._play_hands()
-        self._play_dealer_hand()
-        self._settle_bets()
+        if self.outcome_cache is None:
+            self._play_hands()
+            self._play_dealer_hand()
+            self._settle_bets()
+        else:
+            self.outcome_cache.play_round(self)
         
-    def run_simulation(self, num_games):
-        """Runs multiple rounds of the game."""
-        for round_num in range(num_games):
+    def run_simulation(self, num_games, rounds_before=0, total_rounds=None):
+        """Runs multiple rounds of the game.
+
+        With ``checkpoint_every`` and ``checkpoint_path`` set, the game is
+        checkpointed every ``checkpoint_every`` rounds; see ``load_checkpoint``.
+        A run played in several calls passes the rounds its earlier calls
+        played and its overall length as ``rounds_before`` and
+        ``total_rounds``, so checkpoints and progress follow the whole run.
+        """
+        checkpoint_every = self.checkpoint_every
+        if total_rounds is None:
+            total_rounds = rounds_before + num_games
+        for round_num in range(rounds_before, rounds_before + num_games):
             if self.game_over:
                 break
-            if self.verbose and round_num % 10 == 0:  # Print progress every 10 rounds
-                print(f"Playing round {round_num + 1}/{num_games}")
+            for observer in self.observers:
+                observer.on_round_start(self, round_num, total_rounds)
             self.start_game()
+            if checkpoint_every and (round_num + 1) % checkpoint_every == 0:
+                save_checkpoint(self, self.checkpoint_path, remaining_rounds=total_rounds - round_num - 1)
+        self.record_sink.flush()
         return self.summarize_round_info_list()
 
     def _reset_hands(self):
@@ -50,7 +127,7 @@ class Game:
             
     def _check_deck(self):
         """Check if deck needs to be reshuffled."""
-        if len(self.deck.cards) < (len(self.players) + 1) * 6:
+        if self.deck.cards_remaining() < (len(self.players) + 1) * 6:
             self.deck.reset()
             
     def _place_bets(self):
@@ -64,61 +141,87 @@ class Game:
             
     def _play_hands(self):
         """Play out each player's hands."""
-        max_decisions_per_hand = 5  # Reduced to 5 as that should be maximum needed
-        
+        if self.observers:
+            self._play_hands_observed()
+        else:
+            self._play_hands_headless()
+            
+    def _play_hands_headless(self):
+        """Plays every hand with no tracing: the fast path for batch runs."""
+        deck = self.deck
+        for player in self.players:
+            for hand in player.hands:
+                decisions_made = 0
+                while hand.can_hit and decisions_made < MAX_DECISIONS_PER_HAND:
+                    decision, rule = player.make_decision(hand)
+                    hand.decision_list.append((decision, rule))
+                    decisions_made += 1
+                    
+                    if decision == "hit":
+                        hand.add_card(deck.deal_card())
+                        if hand.is_bust():
+                            hand.can_hit = False
+                            hand.result = "lose"
+                    elif decision == "stand":
+                        hand.can_hit = False
+                    elif decision == "double down":
+                        player.double_down(hand)
+                    elif decision == "split":
+                        player.split_hand(hand)
+                        
+                if decisions_made >= MAX_DECISIONS_PER_HAND:
+                    hand.can_hit = False
+                    
+    def _play_hands_observed(self):
+        """Plays every hand like ``_play_hands_headless``, reporting each step to the observers."""
+        observers = self.observers
+        dealer = self.dealer
         for player in self.players:
-            if self.verbose:
-                print(f"\n=== {player.name}'s turn ===")
+            for observer in observers:
+                observer.on_turn_start(player)
                 
             for hand_index, hand in enumerate(player.hands):
                 decisions_made = 0
-                if self.verbose:
-                    print(f"\nHand {hand_index + 1}: {', '.join(str(card) for card in hand.cards)}")
-                    print(f"Hand value: {hand.get_value()}")
-                    print(f"Dealer shows: {self.dealer.hand.cards[0]}")
+                for observer in observers:
+                    observer.on_hand_start(hand_index, hand, dealer)
                 
-                while hand.can_hit and decisions_made < max_decisions_per_hand:
+                while hand.can_hit and decisions_made < MAX_DECISIONS_PER_HAND:
                     decision, rule = player.make_decision(hand)
                     hand.decision_list.append((decision, rule))
                     decisions_made += 1
-                    
-                    if self.verbose:
-                        print(f"Decision {decisions_made}: {decision} (Rule: {rule})")
+                    for observer in observers:
+                        observer.on_decision(player, hand, decisions_made, decision, rule, dealer)
                     
                     if decision == "hit":
                         new_card = self.deck.deal_card()
                         hand.add_card(new_card)
-                        if self.verbose:
-                            print(f"Drew: {new_card}")
-                            print(f"New hand: {', '.join(str(card) for card in hand.cards)}")
-                            print(f"New value: {hand.get_value()}")
-                        
+                        for observer in observers:
+                            observer.on_card(hand, new_card)
                         if hand.is_bust():
                             hand.can_hit = False
                             hand.result = "lose"
-                            if self.verbose:
-                                print("Bust!")
+                            for observer in observers:
+                                observer.on_bust(hand)
                                 
                     elif decision == "stand":
                         hand.can_hit = False
-                        if self.verbose:
-                            print("Standing")
+                        for observer in observers:
+                            observer.on_stand(hand)
                             
                     elif decision == "double down":
-                        if self.verbose:
-                            print(f"Double down with current bet: {hand.bet}")
+                        for observer in observers:
+                            observer.on_double_down(hand)
                         player.double_down(hand)
                         
                     elif decision == "split":
-                        if self.verbose:
-                            print("Splitting pair")
+                        for observer in observers:
+                            observer.on_split(hand)
                         player.split_hand(hand)
                         
-                if decisions_made >= max_decisions_per_hand:
+                if decisions_made >= MAX_DECISIONS_PER_HAND:
                     hand.can_hit = False
-                    print(f"\nWARNING: Hand forced to end after {max_decisions_per_hand} decisions")
-                    print(f"Final hand state: {', '.join(str(card) for card in hand.cards)}")
-                    print(f"Decision history: {hand.decision_list}")
+                    for observer in observers:
+                        observer.on_forced_end(hand, MAX_DECISIONS_PER_HAND)
             
     def _play_dealer_hand(self):
         """Play out the dealer's hand."""
@@ -151,50 +254,35 @@ class Game:
                         hand.result = "push"
                         player.win(hand.bet)  # Return original bet
                         
+            if player.hands:
+                player.strategy.record_result(player.hands)
+                        
     def summarize_round_info_list(self):
         """Returns a summary of all rounds played."""
         return {
-            'total_rounds': len(self.round_info_list),
+            'total_rounds': self.record_sink.rounds,
             'final_budgets': {player.name: player.budget for player in self.players}
         }
 
-def main():
-    """Command line entry point for running blackjack simulations."""
-    import argparse
-    import yaml
-    from pathlib import Path
-    from ..strategies import (
-        BasicStrategy, 
-        AggressiveStrategy, 
-        ConservativeStrategy
-    )
-    from ..analysis import BlackjackAnalytics
-    
-    # Create argument parser
-    parser = argparse.ArgumentParser(description='Run Blackjack simulation with different strategies.')
-    parser.add_argument('-c', '--config', type=str, default='config.yaml', 
-                       help='Path to configuration file')
-    parser.add_argument('-v', '--verbose', action='store_true', 
-                       help='Override config verbose setting')
-    args = parser.parse_args()
-    
-    # Load configuration
-    config_path = Path(args.config)
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
-    
-    # Create strategy instances
-    strategy_classes = {
-        'BasicStrategy': BasicStrategy,
-        'AggressiveStrategy': AggressiveStrategy,
-        'ConservativeStrategy': ConservativeStrategy
-    }
+def create_game(config, verbose=None, seed=None, sink=None, compiled_strategies=None):
+    """Builds a Game and its players from a configuration dictionary.
+
+    Unless ``sink`` is given, the record sink is chosen by
+    ``simulation.record_sink`` in the config. ``compiled_strategies`` is an
+    optional dict shared between calls, so games built from the same
+    config reuse one compiled table per strategy and parameter set.
+    ``seed`` is an int or SeedSequence; an outcome cache without its own
+    ``seed`` samples from a stream spawned from it.
+    """
+    from .. import strategies
     
     # Create players from config
     players = []
     for player_config in config['players']:
-        strategy_class = strategy_classes[player_config['strategy']]
-        strategy = strategy_class()
+        # Only the strategies actually played get imported
+        if player_config['strategy'] not in STRATEGY_NAMES:
+            raise ValueError(f"Unknown strategy: {player_config['strategy']}")
+        strategy = getattr(strategies, player_config['strategy'])()
         
         # Configure strategy if parameters exist
         if player_config['strategy'] in config['strategies']:
@@ -203,6 +291,19 @@ def main():
                 if param != 'description' and hasattr(strategy, param):
                     setattr(strategy, param, value)
         
+        # Swap stateless strategies for their O(1) table-driven equivalent
+        if config['simulation'].get('compile_strategies', False) and strategy.compilable:
+            if compiled_strategies is None:
+                strategy = strategies.compile_strategy(strategy)
+            else:
+                key = (player_config['strategy'],
+                       repr(sorted(config['strategies'].get(player_config['strategy'], {}).items())))
+                if key not in compiled_strategies:
+                    compiled_strategies[key] = strategies.compile_strategy(strategy)
+                    strategy = compiled_strategies[key]
+                else:
+                    strategy = compiled_strategies[key].for_strategy(strategy)
+        
         player = Player(
             name=player_config['name'],
             budget=player_config['initial_budget'],
@@ -210,24 +311,160 @@ def main():
         )
         players.append(player)
     
+    if sink is None:
+        simulation = config['simulation']
+        sink = create_sink(
+            simulation.get('record_sink', 'memory'),
+            output_dir=simulation['output_dir'],
+            chunk_rounds=simulation.get('chunk_rounds', 10_000)
+        )
+    
+    # Replay pre-shuffled shoes from a shared file instead of shuffling
+    replay_shoes = None
+    if config['game'].get('shoe_file'):
+        from .replay import open_shoe_file
+        replay_shoes = open_shoe_file(config['game']['shoe_file'])
+    
     # Create game with configuration
     game = Game(
         players=players,
-        verbose=args.verbose or config['simulation']['verbose'],
-        minimum_bet=config['game']['minimum_bet']
+        verbose=config['simulation']['verbose'] if verbose is None else verbose,
+        minimum_bet=config['game']['minimum_bet'],
+        num_decks=config['game'].get('num_decks', 6),
+        seed=seed,
+        sink=sink,
+        counting_system=config['game'].get('counting_system', 'hi-lo'),
+        pooled=config['simulation'].get('pooled', False),
+        replay_shoes=replay_shoes,
+        first_shoe=config['game'].get('first_shoe', 0),
+        antithetic=config['game'].get('antithetic', False)
+    )
+    if config['simulation'].get('outcome_cache'):
+        from .outcome_cache import OutcomeCache
+        cache_config = dict(config['simulation']['outcome_cache'])
+        if cache_config.get('seed') is None and seed is not None:
+            if not isinstance(seed, np.random.SeedSequence):
+                seed = np.random.SeedSequence(seed)
+            cache_config['seed'] = int(seed.spawn(1)[0].generate_state(1, np.uint64)[0])
+        game.enable_outcome_cache(OutcomeCache(**cache_config))
+    game.checkpoint_every = config['simulation'].get('checkpoint_every', 0)
+    game.checkpoint_path = config['simulation'].get(
+        'checkpoint_path', f"{config['simulation']['output_dir']}/checkpoint.pkl"
     )
+    return game
+
+def main():
+    """Command line entry point for running blackjack simulations."""
+    import argparse
+    import yaml
+    from pathlib import Path
+    from ..analysis import BlackjackAnalytics, StoppingRule
+    from ..analysis.statistics import write_summary_report
+    from .checkpoint import load_checkpoint
+    
+    # Create argument parser
+    parser = argparse.ArgumentParser(description='Run Blackjack simulation with different strategies.')
+    parser.add_argument('-c', '--config', type=str, default='config.yaml', 
+                       help='Path to configuration file')
+    parser.add_argument('-v', '--verbose', action='store_true', 
+                       help='Override config verbose setting')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                       help='Number of worker processes to split the rounds across')
+    parser.add_argument('-s', '--seed', type=int, default=None,
+                       help='Seed for reproducible shuffling')
+    parser.add_argument('--resume', type=str, default=None, metavar='CHECKPOINT',
+                       help='Continue an interrupted run from its checkpoint file')
+    parser.add_argument('--instrument', action='store_true',
+                       help='Collect phase timings, counters and decide() latencies into instrumentation.json (single-process runs)')
+    args = parser.parse_args()
+    
+    # Load configuration
+    config_path = Path(args.config)
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+    
+    num_rounds = config['simulation']['num_rounds']
+    output_dir = config['simulation']['output_dir']
+    
+    # Only single-process runs checkpoint, so only they can be resumed
+    if args.resume:
+        if config.get('sweep'):
+            parser.error("--resume can't be used with a sweep")
+        if config.get('tables'):
+            parser.error("--resume can't be used with multiple tables")
+        if args.workers > 1:
+            parser.error("--resume can't be used with --workers > 1")
+    
+    if config.get('sweep'):
+        from .sweep import run_sweep, write_sweep_results
+        # One row per grid cell and player; cells already cached are skipped
+        rows = run_sweep(config, workers=args.workers, seed=args.seed)
+        path = write_sweep_results(rows, output_dir)
+        print(f"Wrote {len(rows)} rows ({sum(row['cached'] for row in rows)} cached) to {path}")
+        return rows
+    
+    if config.get('tables'):
+        from .scheduler import run_tables
+        # Many tables interleaved per process; only the summary is reported
+        results = run_tables(config, num_rounds, workers=args.workers, seed=args.seed)
+        write_summary_report(results, output_dir)
+        return results
+    
+    if args.workers > 1:
+        from .parallel import run_parallel_simulation
+        # Per-round history stays in the workers; only the summary is reported
+        results = run_parallel_simulation(config, num_rounds, args.workers, seed=args.seed)
+        write_summary_report(results, output_dir)
+        return results
+    
+    if args.resume:
+        game, num_rounds = load_checkpoint(args.resume)
+    else:
+        game = create_game(config, verbose=args.verbose or config['simulation']['verbose'], seed=args.seed)
+    if config['simulation'].get('variance_reduction') and game.record_sink.aggregator is None:
+        parser.error(f"simulation.variance_reduction needs a record_sink that keeps statistics, "
+                     f"not {config['simulation'].get('record_sink')!r}")
+    if args.instrument:
+        game.enable_instrumentation()
     
     # Run analysis
     analytics = BlackjackAnalytics(game)
-    results = analytics.run_simulation(num_rounds=config['simulation']['num_rounds'])
+    if config['simulation'].get('variance_reduction'):
+        analytics.enable_variance_reduction()
+    adaptive = config['simulation'].get('adaptive')
+    stopping = StoppingRule.from_config(adaptive) if adaptive else None
+    results = analytics.run_simulation(num_rounds=num_rounds, stopping=stopping)
+    if stopping is not None:
+        print(f"Stopped after {results['total_rounds']} rounds: {results['stopped_by']}")
     
-    # Generate reports
-    output_dir = config['simulation']['output_dir']
-    analytics.plot_budget_history(output_dir)
-    analytics.generate_summary_report(output_dir)
-    analytics.export_results(f"{output_dir}/round_info.xlsx")
+    if args.instrument:
+        game.disable_instrumentation()
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        game.stats.dump_json(f"{output_dir}/instrumentation.json")
+        print(game.stats.report())
+    
+    if game.outcome_cache is not None:
+        cache_stats = game.outcome_cache.stats()
+        print(f"Outcome cache: {cache_stats['rounds_answered']} rounds answered, "
+              f"{cache_stats['rounds_played']} played, {cache_stats['hit_rate']:.1%} hit rate, "
+              f"{cache_stats['evictions']} evictions, {cache_stats['entries']} entries")
+    
+    if config['simulation'].get('variance_reduction'):
+        print(analytics.generate_variance_report(output_dir))
+    
+    # Generate reports from whatever the record sink kept
+    if not isinstance(game.record_sink, NullSink):
+        analytics.plot_budget_history(output_dir)
+        analytics.generate_summary_report(output_dir)
+        if config['simulation'].get('excel_summary', False):
+            analytics.export_summary_excel(f"{output_dir}/summary.xlsx")
+    if game.record_sink.keeps_rounds:
+        analytics.export_results(
+            f"{output_dir}/round_info",
+            format=config['simulation'].get('export_format', 'parquet')
+        )
     
     return results
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
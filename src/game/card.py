@@ -1,18 +1,66 @@
+SUITS = ('Hearts', 'Diamonds', 'Clubs', 'Spades')
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace')
+
+# Cards in the shoe are stored as small integers: code = rank_index * 4 + suit_index.
+# The tables below are indexed by that code, so value and count lookups never
+# touch strings or allocate Card objects.
+NUM_CARD_CODES = len(RANKS) * len(SUITS)
+
+
+def _rank_value(rank):
+    if rank in ['Jack', 'Queen', 'King']:
+        return 10
+    elif rank == 'Ace':
+        return 11
+    return int(rank)
+
+
+def _hi_lo_tag(value):
+    if value >= 10:
+        return -1
+    elif value <= 6:
+        return 1
+    return 0
+
+
+CARD_RANKS = tuple(RANKS[code >> 2] for code in range(NUM_CARD_CODES))
+CARD_SUITS = tuple(SUITS[code & 3] for code in range(NUM_CARD_CODES))
+CARD_VALUES = tuple(_rank_value(rank) for rank in CARD_RANKS)
+CARD_NAMES = tuple(f"{rank} of {suit}" for rank, suit in zip(CARD_RANKS, CARD_SUITS))
+HI_LO_TAGS = tuple(_hi_lo_tag(value) for value in CARD_VALUES)
+
+# Count tags per rank, in RANKS order
+_KO_RANK_TAGS = (1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1, -1)
+_OMEGA_II_RANK_TAGS = (1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0)
+KO_TAGS = tuple(_KO_RANK_TAGS[code >> 2] for code in range(NUM_CARD_CODES))
+OMEGA_II_TAGS = tuple(_OMEGA_II_RANK_TAGS[code >> 2] for code in range(NUM_CARD_CODES))
+
+
+def encode_card(rank, suit):
+    """Returns the integer code for a rank and suit."""
+    return RANKS.index(rank) * 4 + SUITS.index(suit)
+
+
 class Card:
     """Represents a playing card."""
     
     def __init__(self, rank, suit):
         self.rank = rank
         self.suit = suit
+
+    @classmethod
+    def from_code(cls, code):
+        """Builds a Card from its integer shoe code."""
+        return cls(CARD_RANKS[code], CARD_SUITS[code])
         
     def __str__(self):
         return f"{self.rank} of {self.suit}"
+
+    @property
+    def code(self):
+        """Returns the integer shoe code of the card."""
+        return encode_card(self.rank, self.suit)
         
     def blackjack_value(self):
         """Returns the blackjack value of the card."""
-        if self.rank in ['Jack', 'Queen', 'King']:
-            return 10
-        elif self.rank == 'Ace':
-            return 11
-        else:
-            return int(self.rank) 
\ No newline at end of file
+        return _rank_value(self.rank)
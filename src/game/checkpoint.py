@@ -0,0 +1,50 @@
+import os
+import pickle
+import tempfile
+
+CHECKPOINT_VERSION = 2
+
+
+def save_checkpoint(game, path, remaining_rounds=0):
+    """Atomically writes the full state of ``game`` to ``path``.
+
+    The game is pickled with its players, strategies, shoe order and
+    position, RNG state, dealer and record sink, into a temporary file in
+    the same directory that then replaces ``path``, so a crash mid-write
+    leaves the previous checkpoint intact. Instrumentation wrappers are
+    taken off while writing; the collected stats are kept.
+    """
+    from ..utils.instrumentation import instrument, uninstrument
+
+    instrumented = bool(getattr(game, '_instrumented', None))
+    if instrumented:
+        uninstrument(game)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump({
+                'version': CHECKPOINT_VERSION,
+                'remaining_rounds': remaining_rounds,
+                'game': game,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    finally:
+        if instrumented:
+            instrument(game, stats=game.stats)
+
+
+def load_checkpoint(path):
+    """Returns ``(game, remaining_rounds)`` from a checkpoint written by ``save_checkpoint``."""
+    with open(path, 'rb') as f:
+        checkpoint = pickle.load(f)
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {checkpoint.get('version')} in {path}")
+    return checkpoint['game'], checkpoint['remaining_rounds']
@@ -1,16 +1,18 @@
+from .card import CARD_VALUES
 from .hand import Hand
 
 class Dealer:
     """Represents the dealer in the game."""
     
-    def __init__(self):
+    def __init__(self, pooled=False):
         self.hand = Hand()
+        self.pooled = pooled  # Reset the same hand in place every round
         
     def deal_cards(self, players, deck):
         """Deals initial cards to all players and dealer."""
         for player in players:
             if player.initial_bet:
-                initial_hand = Hand()
+                initial_hand = player.new_hand()
                 initial_hand.bet = player.initial_bet
                 initial_hand.add_card(deck.deal_card())
                 initial_hand.add_card(deck.deal_card())
@@ -19,6 +21,10 @@ class Dealer:
         self.hand.add_card(deck.deal_card())
         self.hand.add_card(deck.deal_card())
         
+    def up_card_value(self):
+        """Returns the blackjack value of the dealer's face-up card."""
+        return CARD_VALUES[self.hand.cards[0]]
+
     def play(self, deck):
         """Plays the dealer's hand according to casino rules."""
         while self.hand.get_value() < 17:
@@ -26,4 +32,7 @@ class Dealer:
             
     def reset_hand(self):
         """Resets the dealer's hand."""
-        self.hand = Hand() 
\ No newline at end of file
+        if self.pooled:
+            self.hand.reset()
+        else:
+            self.hand = Hand() 
\ No newline at end of file
@@ -0,0 +1,113 @@
+from functools import lru_cache
+
+from .card import NUM_CARD_CODES, CARD_VALUES
+
+DEALER_STANDS_ON = 17
+# Final dealer outcomes, in the order distributions are returned
+OUTCOMES = (17, 18, 19, 20, 21, 'bust')
+BUST = len(OUTCOMES) - 1
+
+# A shoe composition is a tuple of card counts for the values 2..11 (ace = 11).
+NUM_VALUES = 10
+SINGLE_DECK = tuple(
+    sum(1 for code in range(NUM_CARD_CODES) if CARD_VALUES[code] == value)
+    for value in range(2, 12)
+)
+
+
+def full_shoe(num_decks=6):
+    """Returns the composition of a freshly reset shoe."""
+    return tuple(count * num_decks for count in SINGLE_DECK)
+
+
+def _final(value):
+    distribution = [0.0] * len(OUTCOMES)
+    distribution[BUST if value > 21 else value - DEALER_STANDS_ON] = 1.0
+    return tuple(distribution)
+
+
+@lru_cache(maxsize=1_000_000)
+def _dealer_outcomes(hard_total, has_ace, composition):
+    """Distribution of the dealer's final total from a partial hand, drawing from ``composition``."""
+    value = hard_total + 10 if has_ace and hard_total <= 11 else hard_total
+    if value >= DEALER_STANDS_ON:
+        return _final(value)
+
+    remaining = sum(composition)
+    if not remaining:
+        # Deck.deal_card reshuffles an empty shoe; every value is then drawn in
+        # full-shoe proportions.
+        composition = SINGLE_DECK
+        remaining = sum(composition)
+
+    distribution = [0.0] * len(OUTCOMES)
+    for index, count in enumerate(composition):
+        if not count:
+            continue
+        card = index + 2
+        drawn = composition[:index] + (count - 1,) + composition[index + 1:]
+        outcome = _dealer_outcomes(
+            hard_total + (1 if card == 11 else card), has_ace or card == 11, drawn
+        )
+        weight = count / remaining
+        for k, p in enumerate(outcome):
+            distribution[k] += weight * p
+    return tuple(distribution)
+
+
+def dealer_distribution(up_card, composition):
+    """Returns the exact distribution of the dealer's final total.
+
+    ``up_card`` is the value (2-11) of the dealer's face-up card and
+    ``composition`` the counts of unseen cards by value, excluding the up
+    card. The dealer draws a hole card and hits below 17, standing on soft
+    17, exactly like ``Dealer.play``. Probabilities are ordered as
+    ``OUTCOMES``; results are memoized on the composition.
+    """
+    return _dealer_outcomes(1 if up_card == 11 else up_card, up_card == 11, tuple(composition))
+
+
+class DealerOdds:
+    """Dealer outcome probabilities for a shoe whose composition changes as cards are dealt.
+
+    Removing or adding a card is O(1); distributions are computed on first
+    query for a composition and served from the memo afterwards.
+    """
+
+    def __init__(self, composition=None, num_decks=6):
+        self.composition = list(composition if composition is not None else full_shoe(num_decks))
+
+    @classmethod
+    def from_deck(cls, deck):
+        """Builds the odds for the cards still left in ``deck``."""
+        return cls(deck.composition())
+
+    def remove(self, value):
+        """Takes one card of ``value`` out of the shoe."""
+        self.composition[value - 2] -= 1
+
+    def add(self, value):
+        """Puts one card of ``value`` back into the shoe."""
+        self.composition[value - 2] += 1
+
+    def remove_card(self, card):
+        """Takes one card code out of the shoe."""
+        self.composition[CARD_VALUES[card] - 2] -= 1
+
+    def distribution(self, up_card):
+        """Returns final-total probabilities when the up card is dealt from this shoe.
+
+        For a round already in progress, where the up card has left the
+        shoe, use ``dealer_distribution(up_card, deck.composition())``.
+        """
+        composition = list(self.composition)
+        composition[up_card - 2] -= 1
+        return dealer_distribution(up_card, composition)
+
+    def bust_probability(self, up_card):
+        """Returns the probability that the dealer busts."""
+        return self.distribution(up_card)[BUST]
+
+    def table(self):
+        """Returns ``{up_card: distribution}`` for every up card value."""
+        return {up_card: self.distribution(up_card) for up_card in range(2, 12)}
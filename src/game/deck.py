@@ -1,54 +1,193 @@
-import random
-from .card import Card
+from array import array
+
+import numpy as np
+
+from .card import NUM_CARD_CODES, RANKS, CARD_VALUES, HI_LO_TAGS, KO_TAGS, OMEGA_II_TAGS
+
+CARDS_PER_DECK = NUM_CARD_CODES
+# Counting system name -> count tag per card code
+COUNTING_SYSTEMS = {
+    'hi-lo': HI_LO_TAGS,
+    'ko': KO_TAGS,
+    'omega-ii': OMEGA_II_TAGS,
+}
+# Card code -> the same suit of the mirrored rank (2 <-> Ace, 3 <-> King, ..., 8 <-> 8)
+MIRRORED_CARDS = np.array(
+    [(len(RANKS) - 1 - (code >> 2)) * 4 + (code & 3) for code in range(NUM_CARD_CODES)], dtype=np.uint8
+)
 
 class Counter:
-    """Keeps track of card counting metrics."""
-    def __init__(self):
-        self.count = 0
+    """Keeps the running count of a tag-based counting system.
+
+    Balanced systems (Hi-Lo, Omega II) start at 0. Unbalanced ones (KO)
+    start at the conventional initial running count of ``-bias * (decks - 1)``,
+    where ``bias`` is the sum of the tags over one deck.
+    """
+    def __init__(self, system='hi-lo', num_decks=6):
+        if system not in COUNTING_SYSTEMS:
+            raise ValueError(f"Unknown counting system: {system}")
+        self.system = system
+        self.tags = COUNTING_SYSTEMS[system]
+        self.num_decks = num_decks
+        self.deck_bias = sum(self.tags)
+        self.initial_count = -self.deck_bias * (num_decks - 1)
+        self.count = self.initial_count
+        
+    def reset(self):
+        """Resets the running count for a fresh shoe."""
+        self.count = self.initial_count
         
     def update(self, card):
         """Updates running count based on card value."""
-        value = card.blackjack_value()
-        if value >= 10:
-            self.count -= 1
-        elif value <= 6:
-            self.count += 1
+        self.count += self.tags[card]
+        
+    def true_count(self, cards_remaining):
+        """Returns the running count per deck remaining.
+
+        For unbalanced systems the tags expected from the decks already
+        dealt are taken out first, so every system is centred on 0.
+        """
+        if not cards_remaining:
+            return 0.0
+        decks_remaining = cards_remaining / CARDS_PER_DECK
+        dealt = self.count - self.initial_count - self.deck_bias * (self.num_decks - decks_remaining)
+        return dealt / decks_remaining
 
 class Deck:
-    """Represents a deck of playing cards."""
+    """Represents a shoe of integer-encoded playing cards.
+
+    The shoe is a preallocated byte array that is refilled in place on every
+    reset; cards are dealt by advancing a cursor. Shuffled shoes come from a
+    per-deck ``numpy.random.Generator``, ``shoe_batch`` at a time from one
+    vectorized permutation call, so a given seed always deals the same
+    cards and decks never share RNG state. The running
+    count, the remaining cards per rank (``rank_counts``, in ``RANKS`` order)
+    and their total value are updated as each card is dealt, so every count
+    query is O(1).
+
+    With ``replay_shoes``, a ``(num_shoes, cards_per_shoe)`` array such as a
+    shoe file opened by ``open_shoe_file``, the deck deals those shoes in
+    order from ``first_shoe`` instead of shuffling, wrapping around at the
+    end. Batches are views into the array, so a memory-mapped file is read
+    straight from the page cache.
+
+    With ``antithetic``, shuffled shoes come in pairs: every second shoe is
+    the previous one with each rank mirrored (2 <-> Ace, 3 <-> King, ...),
+    which keeps the composition but swaps low and high cards. Shoes
+    ``2k`` and ``2k + 1`` in ``shoes_dealt`` order form a pair. Replayed
+    shoes are dealt as they are, so the two can't be combined.
+    """
     
-    def __init__(self, num_decks=6):
+    def __init__(self, num_decks=6, seed=None, counting_system='hi-lo', shoe_batch=64,
+                 replay_shoes=None, first_shoe=0, antithetic=False):
         self.num_decks = num_decks
-        self.counter = Counter()
+        # seed may be anything np.random.default_rng accepts, or a Generator to draw from
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        self.counter = Counter(counting_system, num_decks)
+        self.shoe_batch = shoe_batch
+        self._full_shoe = array('B', range(NUM_CARD_CODES)) * num_decks
+        if replay_shoes is not None and replay_shoes.shape[1:] != (len(self._full_shoe),):
+            raise ValueError(
+                f"Replay shoes of shape {replay_shoes.shape} don't hold {num_decks}-deck shoes"
+            )
+        self.replay_shoes = replay_shoes
+        self.antithetic = antithetic
+        if antithetic and replay_shoes is not None:
+            raise ValueError("Antithetic shoes can't be combined with replayed shoes")
+        if antithetic and shoe_batch % 2:
+            raise ValueError("Antithetic shoes need an even shoe_batch")
+        self.shoes_dealt = 0
+        self._replay_position = first_shoe % len(replay_shoes) if replay_shoes is not None else 0
+        self._full_value = sum(CARD_VALUES) * num_decks
+        self._shoes = np.empty((0, len(self._full_shoe)), dtype=np.uint8)
+        self._next_shoe = 0
+        self.cards = array('B', self._full_shoe)
+        self.position = 0
         self.reset()
         
-    def reset(self):
-        """Resets the deck to its initial state."""
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
+    def _generate_shoes(self):
+        """Loads the next ``shoe_batch`` shoes, replayed or shuffled with one batched permutation."""
+        if self.replay_shoes is not None:
+            start = self._replay_position
+            self._shoes = self.replay_shoes[start:start + self.shoe_batch]
+            self._replay_position = (start + len(self._shoes)) % len(self.replay_shoes)
+        else:
+            num_shuffled = self.shoe_batch // 2 if self.antithetic else self.shoe_batch
+            full_shoes = np.tile(np.frombuffer(self._full_shoe, dtype=np.uint8), (num_shuffled, 1))
+            shuffled = self.rng.permuted(full_shoes, axis=1)
+            if self.antithetic:
+                self._shoes = np.empty((self.shoe_batch, shuffled.shape[1]), dtype=np.uint8)
+                self._shoes[0::2] = shuffled
+                self._shoes[1::2] = MIRRORED_CARDS[shuffled]
+            else:
+                self._shoes = shuffled
+        self._next_shoe = 0
         
-        self.cards = []
-        for _ in range(self.num_decks):
-            for suit in suits:
-                for rank in ranks:
-                    self.cards.append(Card(rank, suit))
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if isinstance(self.replay_shoes, np.memmap):
+            # Pickle a memory-mapped shoe file by name rather than by contents
+            state['replay_shoes'] = self.replay_shoes.filename
+            state['_shoes'] = np.array(self._shoes)
+        return state
         
-        self.shuffle()
-        self.counter.count = 0
+    def __setstate__(self, state):
+        if isinstance(state['replay_shoes'], str):
+            from .replay import open_shoe_file
+            state['replay_shoes'] = open_shoe_file(state['replay_shoes'])
+        self.__dict__.update(state)
+        
+    def reset(self):
+        """Resets the deck to its initial state with the next pre-shuffled shoe."""
+        if self._next_shoe >= len(self._shoes):
+            self._generate_shoes()
+        memoryview(self.cards)[:] = self._shoes[self._next_shoe]
+        self._next_shoe += 1
+        self.shoes_dealt += 1
+        self.position = 0
+        self.counter.reset()
+        self.rank_counts = [len(self._full_shoe) // len(RANKS)] * len(RANKS)
+        self._remaining_value = self._full_value
         
     def shuffle(self):
-        """Shuffles the deck."""
-        random.shuffle(self.cards)
+        """Shuffles the cards in the shoe in place."""
+        memoryview(self.cards)[:] = self.rng.permutation(np.frombuffer(self.cards, dtype=np.uint8))
         
     def deal_card(self):
-        """Deals one card from the deck."""
-        if not self.cards:
+        """Deals one card code from the deck."""
+        if self.position >= len(self.cards):
             self.reset()
         
-        card = self.cards.pop()
-        self.counter.update(card)
+        card = self.cards[self.position]
+        self.position += 1
+        counter = self.counter
+        counter.count += counter.tags[card]
+        self.rank_counts[card >> 2] -= 1
+        self._remaining_value -= CARD_VALUES[card]
         return card
+
+    def cards_remaining(self):
+        """Returns the number of cards left to deal."""
+        return len(self.cards) - self.position
+
+    def decks_remaining(self):
+        """Returns the exact number of decks left to deal."""
+        return (len(self.cards) - self.position) / CARDS_PER_DECK
+
+    def true_count(self):
+        """Returns the running count per deck remaining."""
+        return self.counter.true_count(len(self.cards) - self.position)
+
+    def remaining_cards(self):
+        """Returns the undealt card codes."""
+        return self.cards[self.position:]
+        
+    def composition(self):
+        """Returns the counts of remaining cards by value 2..11 (ace = 11)."""
+        ranks = self.rank_counts
+        # Ranks 2-9 map to one value each, 10/Jack/Queen/King share 10
+        return tuple(ranks[:8]) + (ranks[8] + ranks[9] + ranks[10] + ranks[11], ranks[12])
         
     def total_deck_value(self):
         """Returns total value of remaining cards."""
-        return sum(card.blackjack_value() for card in self.cards) 
\ No newline at end of file
+        return self._remaining_value
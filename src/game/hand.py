@@ -1,5 +1,17 @@
+from .card import CARD_VALUES, CARD_NAMES
+
+
 class Hand:
-    """Represents a hand of playing cards."""
+    """Represents a hand of playing cards.
+
+    The hard total, ace count, value, soft flag and pair flag are kept up to
+    date as cards are added or removed, so every query is O(1).
+    """
+
+    __slots__ = (
+        'cards', 'bet', 'can_hit', 'is_double_down', 'ace_split', 'result',
+        'decision_list', '_hard_total', '_num_aces', '_value', '_is_soft', '_is_pair',
+    )
 
     def __init__(self):
         self.cards = []
@@ -7,57 +19,88 @@ class Hand:
         self.can_hit = True
         self.is_double_down = False
         self.ace_split = False
-        self.is_soft = False
         self.result = None
         self.decision_list = []
+        self._hard_total = 0
+        self._num_aces = 0
+        self._value = 0
+        self._is_soft = False
+        self._is_pair = False
+        
+    def reset(self):
+        """Empties the hand in place so a pooled hand can be reused."""
+        self.cards.clear()
+        self.bet = 0
+        self.can_hit = True
+        self.is_double_down = False
+        self.ace_split = False
+        self.result = None
+        self.decision_list.clear()
+        self._hard_total = 0
+        self._num_aces = 0
+        self._value = 0
+        self._is_soft = False
+        self._is_pair = False
         
     def __str__(self):
         """Returns a string representation of the hand."""
-        hand_str = f"\nCards in hand:\n{', '.join(map(str, self.cards))}\n"
+        hand_str = f"\nCards in hand:\n{', '.join(CARD_NAMES[card] for card in self.cards)}\n"
         hand_str += f"Total value: {self.get_value()}\n"
         hand_str += f"Current bet: {self.bet}\n"
         return hand_str
 
     def add_card(self, card):
-        """Adds a card to the hand."""
+        """Adds a card code to the hand."""
         self.cards.append(card)
+        card_value = CARD_VALUES[card]
+        if card_value == 11:  # Ace, counted as 1 in the hard total
+            self._num_aces += 1
+            self._hard_total += 1
+        else:
+            self._hard_total += card_value
+        self._refresh()
 
-    def get_value(self):
-        """Calculates the hand's value, considering aces."""
-        total = 0
-        num_aces = 0
-        for card in self.cards:
-            card_value = card.blackjack_value()
-            total += card_value
-            if card_value == 11:  # Ace
-                num_aces += 1
-
-        while total > 21 and num_aces > 0:
-            total -= 10  # Change ace value to 1
-            num_aces -= 1
-    
-        # Check if the hand is considered soft
-        if num_aces > 0 and total <= 11:
-            self.is_soft = True
+    def pop_card(self):
+        """Removes and returns the last card code, e.g. when splitting."""
+        card = self.cards.pop()
+        card_value = CARD_VALUES[card]
+        if card_value == 11:
+            self._num_aces -= 1
+            self._hard_total -= 1
         else:
-            self.is_soft = False
+            self._hard_total -= card_value
+        self._refresh()
+        return card
 
-        return total
+    def _refresh(self):
+        """Derives value, soft and pair flags from the running totals."""
+        total = self._hard_total
+        if self._num_aces and total <= 11:  # One ace can count as 11
+            self._value = total + 10
+            self._is_soft = True
+        else:
+            self._value = total
+            self._is_soft = False
+        cards = self.cards
+        self._is_pair = len(cards) == 2 and CARD_VALUES[cards[0]] == CARD_VALUES[cards[1]]
+
+    @property
+    def is_soft(self):
+        """True if an ace in the hand is currently counted as 11."""
+        return self._is_soft
+
+    def get_value(self):
+        """Returns the hand's value, considering aces."""
+        return self._value
    
     def can_split(self):
         """Determines if the hand can be split."""
-        if len(self.cards) != 2:
-            return False
-       
-        first_card_value = self.cards[0].blackjack_value()
-        second_card_value = self.cards[1].blackjack_value()
-       
-        return first_card_value == second_card_value
+        return self._is_pair
 
     def is_blackjack(self):
         """Returns True if the hand is a blackjack."""
-        return len(self.cards) == 2 and self.get_value() == 21
+        return self._value == 21 and len(self.cards) == 2
 
     def is_bust(self):
         """Returns True if the hand's value exceeds 21."""
-        return self.get_value() > 21 
\ No newline at end of file
+        return self._value > 21
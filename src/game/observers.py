@@ -0,0 +1,86 @@
+from .card import CARD_NAMES
+
+
+class RoundObserver:
+    """Receives the events of every round a Game plays.
+
+    Games without observers run a headless executor that emits nothing;
+    adding one switches the game to the observed executor. Override only
+    the events you need.
+    """
+
+    def on_round_start(self, game, round_num, num_games):
+        """Called before each round of ``run_simulation``; ``round_num`` counts from 0."""
+        pass
+
+    def on_turn_start(self, player):
+        pass
+
+    def on_hand_start(self, hand_index, hand, dealer):
+        pass
+
+    def on_decision(self, player, hand, decision_number, decision, rule, dealer):
+        """Called after the strategy decides, before the decision is carried out."""
+        pass
+
+    def on_card(self, hand, card):
+        pass
+
+    def on_bust(self, hand):
+        pass
+
+    def on_stand(self, hand):
+        pass
+
+    def on_double_down(self, hand):
+        """Called before the bet is doubled."""
+        pass
+
+    def on_split(self, hand):
+        pass
+
+    def on_forced_end(self, hand, max_decisions):
+        """Called when a hand is stopped after ``max_decisions`` decisions."""
+        pass
+
+
+class VerbosePrinter(RoundObserver):
+    """Prints a play-by-play trace of every round, including each strategy's reasoning."""
+
+    def on_round_start(self, game, round_num, num_games):
+        if round_num % 10 == 0:  # Print progress every 10 rounds
+            print(f"Playing round {round_num + 1}/{num_games}")
+
+    def on_turn_start(self, player):
+        print(f"\n=== {player.name}'s turn ===")
+
+    def on_hand_start(self, hand_index, hand, dealer):
+        print(f"\nHand {hand_index + 1}: {', '.join(CARD_NAMES[card] for card in hand.cards)}")
+        print(f"Hand value: {hand.get_value()}")
+        print(f"Dealer shows: {CARD_NAMES[dealer.hand.cards[0]]}")
+
+    def on_decision(self, player, hand, decision_number, decision, rule, dealer):
+        print(f"Strategy reasoning: {player.strategy.explain_decision(decision, hand, dealer.up_card_value())}")
+        print(f"Decision {decision_number}: {decision} (Rule: {rule})")
+
+    def on_card(self, hand, card):
+        print(f"Drew: {CARD_NAMES[card]}")
+        print(f"New hand: {', '.join(CARD_NAMES[c] for c in hand.cards)}")
+        print(f"New value: {hand.get_value()}")
+
+    def on_bust(self, hand):
+        print("Bust!")
+
+    def on_stand(self, hand):
+        print("Standing")
+
+    def on_double_down(self, hand):
+        print(f"Double down with current bet: {hand.bet}")
+
+    def on_split(self, hand):
+        print("Splitting pair")
+
+    def on_forced_end(self, hand, max_decisions):
+        print(f"\nWARNING: Hand forced to end after {max_decisions} decisions")
+        print(f"Final hand state: {', '.join(CARD_NAMES[card] for card in hand.cards)}")
+        print(f"Decision history: {hand.decision_list}")
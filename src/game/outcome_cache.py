@@ -0,0 +1,166 @@
+import math
+import random
+from collections import OrderedDict
+
+from .card import CARD_VALUES
+
+
+class OutcomeDistribution:
+    """Observed net results of one seat, in multiples of its initial bet."""
+
+    __slots__ = ('counts', 'samples', 'total')
+
+    def __init__(self):
+        self.counts = {}
+        self.samples = 0
+        self.total = 0.0
+
+    def add(self, multiple):
+        self.counts[multiple] = self.counts.get(multiple, 0) + 1
+        self.samples += 1
+        self.total += multiple
+
+    @property
+    def mean(self):
+        """Expected net result per unit bet."""
+        return self.total / self.samples if self.samples else 0.0
+
+    def sample(self, rng):
+        """Draws a net result with the observed frequencies."""
+        return rng.choices(tuple(self.counts), tuple(self.counts.values()))[0]
+
+
+class OutcomeCache:
+    """Bounded LRU cache of round outcome distributions for deterministic strategies.
+
+    Entries are keyed by strategy, starting hand class (pair value, soft,
+    total), whether the player can afford to double or split, dealer up
+    card and a coarse shoe bucket: the true count, floored and clamped to
+    ``±max_bucket``. Each entry holds the distribution of the seat's net
+    result in multiples of its initial bet, learned from rounds that were
+    played out.
+
+    A seat whose entry has ``min_samples`` results is answered from the
+    cache: its result is drawn from the distribution and its hands are not
+    played. The remaining seats play out as usual, and the dealer only
+    plays when at least one seat does. A fraction ``refresh_rate`` of
+    answerable seats is still played to keep refining the distributions.
+    Answered seats have the right budget changes and EV but not the real
+    cards: a split or doubled seat shows up as one hand carrying the whole
+    result, and observers see no play.
+    """
+
+    def __init__(self, maxsize=100_000, min_samples=100, refresh_rate=0.05, max_bucket=6, seed=None):
+        self.maxsize = maxsize
+        self.min_samples = min_samples
+        self.refresh_rate = refresh_rate
+        self.max_bucket = max_bucket
+        self.rng = random.Random(seed)
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rounds_answered = 0
+        self.rounds_played = 0
+
+    def bucket(self, game):
+        """Returns the shoe bucket of the round being played."""
+        return max(-self.max_bucket, min(self.max_bucket, math.floor(game.deck.true_count())))
+
+    def key(self, player, hand, game, bucket):
+        """Returns the cache key of a seat's starting hand."""
+        cards = hand.cards
+        return (
+            player.strategy.name,
+            CARD_VALUES[cards[0]] if hand.can_split() else 0,
+            hand.is_soft,
+            hand.get_value(),
+            player.budget >= hand.bet,
+            game.dealer.up_card_value(),
+            bucket,
+        )
+
+    def _lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is not None and entry.samples >= self.min_samples and self.rng.random() >= self.refresh_rate:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def _store(self, key, multiple):
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = OutcomeDistribution()
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.entries.move_to_end(key)
+        entry.add(multiple)
+
+    def play_round(self, game):
+        """Plays or answers every seat of the round ``game`` has just dealt, through settlement."""
+        bucket = self.bucket(game)
+        played = []
+        for player in game.players:
+            if not player.hands:
+                continue
+            key = self.key(player, player.hands[0], game, bucket)
+            entry = self._lookup(key)
+            if entry is not None:
+                self._answer(player, entry.sample(self.rng))
+            else:
+                # With the budget before the bet, to measure the seat's net result
+                played.append((player, key, player.budget + player.initial_bet))
+
+        if not played:
+            self.rounds_answered += 1
+            return
+
+        self.rounds_played += 1
+        # Play out only the seats that weren't answered
+        players = game.players
+        game.players = [player for player, _, _ in played]
+        try:
+            game._play_hands()
+            game._play_dealer_hand()
+            game._settle_bets()
+        finally:
+            game.players = players
+        for player, key, budget in played:
+            self._store(key, round((player.budget - budget) / player.initial_bet, 6))
+
+    def _answer(self, player, multiple):
+        hand = player.hands[0]
+        bet = hand.bet
+        player.budget += bet * (1 + multiple)
+        if multiple > 0:
+            hand.result = "win"
+        elif multiple < 0:
+            hand.result = "lose"
+        else:
+            hand.result = "push"
+        if multiple and not hand.is_blackjack():
+            # The hand carries the whole result, e.g. a doubled loss as twice the bet
+            hand.bet = bet * abs(multiple)
+        player.strategy.record_result(player.hands)
+
+    def expected_value(self, key):
+        """Returns the cached EV per unit bet for ``key``, or None if it isn't cached."""
+        entry = self.entries.get(key)
+        return entry.mean if entry is not None else None
+
+    def stats(self):
+        """Returns hit rate, eviction and size metrics."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'rounds_answered': self.rounds_answered,
+            'rounds_played': self.rounds_played,
+        }
@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .blackjack import create_game
+from .replay import open_shoe_file
+from ..utils.aggregation import COUNT_KEYS
+from ..utils.sinks import AggregateSink
+
+
+def summarize_players(game, initial_budgets):
+    """Returns per-player result counts from a game recorded by an AggregateSink."""
+    players = {}
+    for player in game.players:
+        players[player.name] = game.record_sink.aggregator.player(player.name).counts()
+        players[player.name].update({
+            'name': player.name,
+            'strategy': player.strategy.name,
+            'net_result': player.budget - initial_budgets[player.name],
+        })
+    return players
+
+
+def _run_worker(config, num_rounds, seed):
+    """Plays ``num_rounds`` on a fresh Game seeded with ``seed``."""
+    game = create_game(config, verbose=False, seed=seed, sink=AggregateSink())
+    initial_budgets = {player.name: player.budget for player in game.players}
+    game.run_simulation(num_rounds)
+    return game.record_sink.rounds, summarize_players(game, initial_budgets)
+
+
+def merge_results(worker_results):
+    """Merges per-worker summaries into a single simulation summary."""
+    merged = {'total_rounds': 0, 'players': []}
+    by_name = {}
+    for total_rounds, players in worker_results:
+        merged['total_rounds'] += total_rounds
+        for name, stats in players.items():
+            if name not in by_name:
+                by_name[name] = dict(stats)
+                merged['players'].append(by_name[name])
+                continue
+            for key in COUNT_KEYS + ('net_result',):
+                by_name[name][key] += stats[key]
+    return merged
+
+
+def run_parallel_simulation(config, num_rounds, workers, seed=None):
+    """Splits ``num_rounds`` across ``workers`` processes and merges the results.
+
+    Each worker builds its own Game from ``config`` with an independent
+    shoe stream spawned from ``seed``, so a given (seed, workers) pair is
+    reproducible. With a ``game.shoe_file``, the workers instead replay
+    evenly spaced stretches of the file.
+    """
+    worker_seeds = [
+        int(child.generate_state(1, np.uint64)[0])
+        for child in np.random.SeedSequence(seed).spawn(workers)
+    ]
+    rounds_per_worker = [
+        num_rounds // workers + (1 if i < num_rounds % workers else 0)
+        for i in range(workers)
+    ]
+
+    worker_configs = [config] * workers
+    if config['game'].get('shoe_file'):
+        # Start each worker at its own shoe rather than replaying the same ones
+        num_shoes = len(open_shoe_file(config['game']['shoe_file']))
+        first_shoe = config['game'].get('first_shoe', 0)
+        worker_configs = [
+            {**config, 'game': {**config['game'], 'first_shoe': first_shoe + i * num_shoes // workers}}
+            for i in range(workers)
+        ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_worker, worker_config, rounds, worker_seed)
+            for worker_config, rounds, worker_seed in zip(worker_configs, rounds_per_worker, worker_seeds)
+            if rounds
+        ]
+        return merge_results(future.result() for future in futures)
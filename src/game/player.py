@@ -1,5 +1,8 @@
 from src.utils.decorators import round_info_decorator
 from src.game.hand import Hand
+from src.game.card import CARD_VALUES
+
+MAX_HANDS = 3  # Maximum hands per player after splitting
 
 class Player:
     """Represents a player in the game."""
@@ -11,11 +14,25 @@ class Player:
         self.hands = []
         self.game = None
         self.initial_bet = None
+        self.hand_pool = None  # Preallocated hands reused every round, see use_hand_pool()
+        
+    def use_hand_pool(self, size=MAX_HANDS):
+        """Preallocates ``size`` hands that are reset and reused instead of created each round."""
+        self.hand_pool = [Hand() for _ in range(size)]
+        
+    def new_hand(self):
+        """Returns an empty hand for the next slot in ``hands``."""
+        if self.hand_pool is None:
+            return Hand()
+        hand = self.hand_pool[len(self.hands)]
+        hand.reset()
+        return hand
         
     def place_bet(self):
         """Places initial bet for the round."""
         bet_amount = self.strategy.determine_bet(self.game, self.budget)
-        if bet_amount:
+        # Sit out rather than bet nothing, a negative amount or more than is left
+        if bet_amount and 0 < bet_amount <= self.budget:
             self.budget -= bet_amount
             self.initial_bet = bet_amount
             
@@ -30,19 +47,21 @@ class Player:
         hand.add_card(self.game.deck.deal_card())
         hand.can_hit = False
         hand.is_double_down = True
+        if hand.is_bust():
+            hand.result = "lose"
         
     def split_hand(self, hand):
         """Splits a pair into two hands."""
-        if hand.can_split() and len(self.hands) < 3 and not hand.ace_split:
-            second_hand = Hand()
+        if hand.can_split() and len(self.hands) < MAX_HANDS and not hand.ace_split:
+            second_hand = self.new_hand()
             second_hand.bet = hand.bet
             self.budget -= hand.bet
             
-            if hand.cards[0].blackjack_value() == 11:
+            if CARD_VALUES[hand.cards[0]] == 11:
                 hand.ace_split = True
                 second_hand.ace_split = True
                 
-            second_hand.add_card(hand.cards.pop())
+            second_hand.add_card(hand.pop_card())
             second_hand.add_card(self.game.deck.deal_card())
             self.hands.append(second_hand)
             hand.add_card(self.game.deck.deal_card())
@@ -57,5 +76,8 @@ class Player:
         
     def reset_hand(self):
         """Resets player's hands for new round."""
-        self.hands = []
+        if self.hand_pool is None:
+            self.hands = []
+        else:
+            self.hands.clear()
         self.initial_bet = None 
\ No newline at end of file
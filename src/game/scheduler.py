@@ -0,0 +1,169 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .blackjack import create_game
+from .parallel import summarize_players
+from ..utils.aggregation import COUNT_KEYS
+from ..utils.sinks import AggregateSink
+
+
+class TableCollector:
+    """Central store of per-table results streamed in by TableSchedulers.
+
+    Each update replaces the table's previous snapshot, so the collector
+    always holds the latest totals of every table it has heard from.
+    """
+
+    def __init__(self):
+        self.tables = {}
+
+    def update(self, name, rounds, players):
+        """Stores the latest ``rounds`` count and per-player summaries of table ``name``."""
+        self.tables[name] = {'total_rounds': rounds, 'players': players}
+
+    def merge(self, other):
+        """Adds the tables of another collector, e.g. one filled in a worker process."""
+        self.tables.update(other.tables)
+
+    def summary(self):
+        """Returns every table's players, named ``<table> / <player>``, in the parallel summary format."""
+        players = []
+        for name, table in self.tables.items():
+            for player in table['players'].values():
+                player = dict(player)
+                player['table'] = name
+                player['name'] = f"{name} / {player['name']}"
+                players.append(player)
+        return {
+            'total_rounds': sum(table['total_rounds'] for table in self.tables.values()),
+            'num_tables': len(self.tables),
+            'players': players,
+        }
+
+    def strategy_totals(self):
+        """Returns result counts and net result summed per strategy across all tables."""
+        totals = {}
+        for table in self.tables.values():
+            for player in table['players'].values():
+                strategy = totals.setdefault(
+                    player['strategy'], dict.fromkeys(COUNT_KEYS + ('net_result',), 0)
+                )
+                for key in COUNT_KEYS + ('net_result',):
+                    strategy[key] += player[key]
+        return totals
+
+
+class TableScheduler:
+    """Runs many Game tables interleaved in one process.
+
+    Tables take turns playing ``batch_rounds`` rounds each, so they all
+    progress together, and after every batch each table's aggregates are
+    streamed to the collector. Tables built with ``from_config`` share
+    one compiled decision table per strategy; card lookups and solved
+    OptimalStrategy tables are module-level and shared by every table
+    anyway.
+    """
+
+    def __init__(self, collector=None, batch_rounds=1000):
+        self.collector = collector if collector is not None else TableCollector()
+        self.batch_rounds = batch_rounds
+        self.tables = {}
+        self._initial_budgets = {}
+
+    @classmethod
+    def from_config(cls, config, seed=None, table_indices=None, **kwargs):
+        """Builds a scheduler for the tables listed under ``tables`` in the config.
+
+        Each table entry has a ``name`` and a ``players`` list like the
+        top-level one; the game, simulation and strategy settings are
+        shared. Table ``i`` deals from a stream spawned from ``seed`` by
+        its index, so results don't depend on which tables run together.
+        """
+        scheduler = cls(**kwargs)
+        table_configs = config['tables']
+        table_seeds = np.random.SeedSequence(seed).spawn(len(table_configs))
+        compiled_strategies = {}
+        for index in (range(len(table_configs)) if table_indices is None else table_indices):
+            table_config = copy.copy(config)
+            table_config['players'] = table_configs[index]['players']
+            name = table_configs[index].get('name', f"Table {index + 1}")
+            game = create_game(
+                table_config, verbose=False, seed=table_seeds[index],
+                sink=AggregateSink(), compiled_strategies=compiled_strategies,
+            )
+            scheduler.add_table(name, game)
+        return scheduler
+
+    def add_table(self, name, game):
+        """Adds a Game to be scheduled under ``name``."""
+        if name in self.tables:
+            raise ValueError(f"Duplicate table name: {name}")
+        self.tables[name] = game
+        self._initial_budgets[name] = {player.name: player.budget for player in game.players}
+
+    def run(self, num_rounds):
+        """Plays ``num_rounds`` rounds at every table and returns the collector's summary."""
+        played = dict.fromkeys(self.tables, 0)
+        active = list(self.tables)
+        while active:
+            for name in list(active):
+                game = self.tables[name]
+                batch = min(self.batch_rounds, num_rounds - played[name])
+                for _ in range(batch):
+                    if game.game_over:
+                        break
+                    game.start_game()
+                played[name] += batch
+                self.collect(name)
+                if played[name] >= num_rounds or game.game_over:
+                    active.remove(name)
+
+        for game in self.tables.values():
+            game.record_sink.flush()
+        return self.collector.summary()
+
+    def collect(self, name):
+        """Streams table ``name``'s current aggregates to the collector."""
+        game = self.tables[name]
+        self.collector.update(
+            name, game.record_sink.rounds, summarize_players(game, self._initial_budgets[name])
+        )
+
+
+def _run_table_worker(config, num_rounds, seed, table_indices):
+    """Runs a subset of the configured tables in one worker process."""
+    scheduler = TableScheduler.from_config(config, seed=seed, table_indices=table_indices)
+    scheduler.run(num_rounds)
+    return scheduler.collector
+
+
+def run_tables(config, num_rounds, workers=1, seed=None):
+    """Runs every table in ``config['tables']`` for ``num_rounds`` rounds and returns the summary.
+
+    With ``workers > 1`` the tables are dealt round-robin to a process pool,
+    each worker interleaving its share with a TableScheduler. Per-table
+    seeds don't depend on the worker count, so results are reproducible by
+    ``seed`` alone.
+    """
+    # Fix the entropy here so every worker spawns the same per-table streams
+    seed = np.random.SeedSequence(seed).entropy
+    num_tables = len(config['tables'])
+    if workers <= 1:
+        return TableScheduler.from_config(config, seed=seed).run(num_rounds)
+
+    shares = [list(range(num_tables))[i::workers] for i in range(workers)]
+    collector = TableCollector()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_table_worker, config, num_rounds, seed, share)
+            for share in shares if share
+        ]
+        for future in futures:
+            collector.merge(future.result())
+
+    # Report tables in config order regardless of which worker ran them
+    order = [table.get('name', f"Table {i + 1}") for i, table in enumerate(config['tables'])]
+    collector.tables = {name: collector.tables[name] for name in order}
+    return collector.summary()
@@ -0,0 +1,426 @@
+"""Local asyncio service that runs simulation jobs on a process pool.
+
+Jobs are submitted as JSON over HTTP, run on a pool of worker processes
+with at most ``max_concurrent`` at a time, and stream their running
+aggregates as server-sent events. Finished results are cached by
+``sweep.config_hash`` (config, rounds and seed), so resubmitting a seeded job
+answers at once.
+
+Endpoints:
+    POST   /jobs              {"config": {...}, "num_rounds": N, "seed": S, "progress_rounds": R}
+    GET    /jobs              every job's status
+    GET    /jobs/<id>         one job, with its latest aggregates or result
+    GET    /jobs/<id>/events  progress as server-sent events until the job ends
+    DELETE /jobs/<id>         cancel a queued or running job
+    GET    /stats             job counts and result cache metrics
+
+``config`` is merged section by section over the service's base config,
+so a payload only needs the settings it changes.
+
+Usage:
+    python -m src.game.service -c config.yaml --port 8765 --max-concurrent 2
+"""
+import asyncio
+import copy
+import itertools
+import json
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from .blackjack import STRATEGY_NAMES, create_game
+from .parallel import summarize_players
+from .sweep import config_hash
+from ..utils.sinks import AggregateSink
+
+FINISHED = ('completed', 'cancelled', 'failed')
+MAX_BODY_BYTES = 1 << 20
+REASONS = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 413: 'Payload Too Large'}
+
+
+def merge_config(base, overrides):
+    """Returns ``base`` with each section of ``overrides`` merged over it; lists are replaced."""
+    config = copy.deepcopy(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(config.get(key), dict):
+            config[key] = {**config[key], **value}
+        else:
+            config[key] = copy.deepcopy(value)
+    return config
+
+
+def _snapshot(game, initial_budgets, num_rounds):
+    """Returns the running aggregates of a job's game."""
+    players = summarize_players(game, initial_budgets)
+    for name, summary in players.items():
+        aggregate = game.record_sink.aggregator.player(name)
+        summary['net_mean'] = aggregate.net_mean
+        summary['net_std'] = aggregate.net_variance ** 0.5
+    return {'total_rounds': game.record_sink.rounds, 'num_rounds': num_rounds,
+            'players': list(players.values())}
+
+
+def _run_job(job_id, config, num_rounds, seed, progress_rounds, events, cancelled):
+    """Plays a job in a worker process, posting a snapshot to ``events`` every ``progress_rounds`` rounds.
+
+    Checks ``cancelled`` between batches and stops early, returning the
+    rounds played so far, once the job's id is in it. With
+    ``simulation.adaptive`` set, batches are the stopping rule's
+    ``batch_rounds`` instead.
+    """
+    from ..analysis import StoppingRule
+
+    game = create_game(config, verbose=False, seed=seed, sink=AggregateSink())
+    initial_budgets = {player.name: player.budget for player in game.players}
+    adaptive = config['simulation'].get('adaptive')
+    stopping = StoppingRule.from_config(adaptive) if adaptive else None
+    if stopping is not None:
+        progress_rounds = stopping.batch_rounds
+
+    status, stopped_by = 'completed', None
+    played = 0
+    while played < num_rounds:
+        if job_id in cancelled:
+            status = 'cancelled'
+            break
+        batch = min(progress_rounds, num_rounds - played)
+        game.run_simulation(batch)
+        played += batch
+        events.put((job_id, 'progress', _snapshot(game, initial_budgets, num_rounds)))
+        if stopping is not None:
+            stopped_by = stopping.check(game)
+            if stopped_by is not None:
+                break
+
+    result = _snapshot(game, initial_budgets, num_rounds)
+    result['status'] = status
+    if stopping is not None:
+        result['stopped_by'] = stopped_by or 'num_rounds'
+    return result
+
+
+class Job:
+    """A submitted simulation, its latest aggregates and its event subscribers."""
+
+    def __init__(self, job_id, config, num_rounds, seed, progress_rounds, key):
+        self.id = job_id
+        self.config = config
+        self.num_rounds = num_rounds
+        self.seed = seed
+        self.progress_rounds = progress_rounds
+        self.key = key  # Result cache key, None for unseeded jobs
+        self.status = 'queued'
+        self.cached = False
+        self.progress = None
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.task = None
+        self.subscribers = set()
+
+    def publish(self, event, data):
+        for queue in self.subscribers:
+            queue.put_nowait((event, data))
+
+    def finish(self, status, result=None, error=None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished = time.time()
+        self.publish(status, self.to_dict())
+
+    def to_dict(self):
+        info = {
+            'id': self.id,
+            'status': self.status,
+            'num_rounds': self.num_rounds,
+            'seed': self.seed,
+            'cached': self.cached,
+            'submitted': self.submitted,
+            'started': self.started,
+            'finished': self.finished,
+        }
+        if self.result is not None:
+            info['result'] = self.result
+        elif self.progress is not None:
+            info['progress'] = self.progress
+        if self.error is not None:
+            info['error'] = self.error
+        return info
+
+
+class SimulationService:
+    """Schedules simulation jobs onto a process pool from an asyncio event loop.
+
+    At most ``max_concurrent`` jobs run at once, each on its own worker
+    process; the rest wait in submission order. Workers post running
+    aggregates through a manager queue, which a pump task fans out to the
+    jobs' subscribers. Results of seeded jobs are kept in an LRU of
+    ``cache_size`` entries keyed by ``config_hash``.
+    """
+
+    def __init__(self, config, max_concurrent=2, cache_size=128, progress_rounds=1000):
+        self.config = config
+        self.max_concurrent = max_concurrent
+        self.cache_size = cache_size
+        self.progress_rounds = progress_rounds
+        self.jobs = {}
+        self.results = OrderedDict()
+        self.cache_hits = 0
+        self._ids = itertools.count(1)
+        self._slots = None
+        self._executor = None
+        self._manager = None
+        self._pump = None
+
+    async def start(self):
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        # Forked workers would inherit open client sockets and hold connections open
+        context = multiprocessing.get_context('spawn')
+        self._manager = context.Manager()
+        self._events = self._manager.Queue()
+        self._cancelled = self._manager.dict()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_concurrent, mp_context=context)
+        self._pump = asyncio.create_task(self._pump_events())
+
+    async def close(self):
+        """Cancels every unfinished job and shuts the pool down."""
+        for job in self.jobs.values():
+            if job.status not in FINISHED:
+                self.cancel(job.id)
+        tasks = [job.task for job in self.jobs.values() if job.task is not None]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._events.put(None)
+        await self._pump
+        self._executor.shutdown()
+        self._manager.shutdown()
+
+    async def _pump_events(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await loop.run_in_executor(None, self._events.get)
+            if event is None:
+                return
+            job_id, name, data = event
+            job = self.jobs.get(job_id)
+            if job is not None and job.status == 'running':
+                job.progress = data
+                job.publish(name, data)
+
+    def submit(self, overrides=None, num_rounds=None, seed=None, progress_rounds=None):
+        """Queues a job and returns it; raises ValueError for an invalid request."""
+        config = merge_config(self.config, overrides or {})
+        if not config.get('players'):
+            raise ValueError("The config has no players")
+        for player in config['players']:
+            if player.get('strategy') not in STRATEGY_NAMES:
+                raise ValueError(f"Unknown strategy: {player.get('strategy')}")
+        config.setdefault('strategies', {})
+        num_rounds = int(num_rounds if num_rounds is not None else config['simulation']['num_rounds'])
+        progress_rounds = int(progress_rounds or self.progress_rounds)
+        if num_rounds < 1 or progress_rounds < 1:
+            raise ValueError("num_rounds and progress_rounds must be positive")
+
+        key = config_hash(config, num_rounds, seed) if seed is not None else None
+        job = Job(str(next(self._ids)), config, num_rounds, seed, progress_rounds, key)
+        self.jobs[job.id] = job
+        if key is not None and key in self.results:
+            self.results.move_to_end(key)
+            self.cache_hits += 1
+            job.cached = True
+            job.finish('completed', self.results[key])
+        else:
+            job.task = asyncio.create_task(self._run(job))
+        return job
+
+    async def _run(self, job):
+        try:
+            async with self._slots:
+                job.status = 'running'
+                job.started = time.time()
+                job.publish('running', job.to_dict())
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, _run_job, job.id, job.config, job.num_rounds, job.seed,
+                    job.progress_rounds, self._events, self._cancelled,
+                )
+        except asyncio.CancelledError:
+            # Cancelled while waiting for a slot
+            job.finish('cancelled')
+            return
+        except Exception as e:
+            job.finish('failed', error=f"{type(e).__name__}: {e}")
+            return
+        finally:
+            self._cancelled.pop(job.id, None)
+
+        if result['status'] == 'completed' and job.key is not None:
+            self.results[job.key] = result
+            if len(self.results) > self.cache_size:
+                self.results.popitem(last=False)
+        job.finish(result['status'], result)
+
+    def cancel(self, job_id):
+        """Cancels a job: a queued job at once, a running one after its current batch."""
+        job = self.jobs[job_id]
+        if job.status == 'queued':
+            job.task.cancel()
+        elif job.status == 'running':
+            self._cancelled[job_id] = True
+        return job
+
+    async def events(self, job):
+        """Yields ``(event, data)`` for a job, starting with its current state, until it finishes."""
+        queue = asyncio.Queue()
+        job.subscribers.add(queue)
+        try:
+            yield job.status, job.to_dict()
+            if job.status in FINISHED:
+                return
+            while True:
+                event, data = await queue.get()
+                yield event, data
+                if event in FINISHED:
+                    return
+        finally:
+            job.subscribers.discard(queue)
+
+    def stats(self):
+        """Returns job counts by status and result cache metrics."""
+        counts = dict.fromkeys(('queued', 'running') + FINISHED, 0)
+        for job in self.jobs.values():
+            counts[job.status] += 1
+        return {'jobs': counts, 'cached_results': len(self.results), 'cache_hits': self.cache_hits}
+
+    async def handle(self, reader, writer):
+        """Serves one HTTP/1.1 request per connection."""
+        try:
+            request_line = await reader.readline()
+            method, path, _ = request_line.decode('latin-1').split(' ', 2)
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get('content-length', 0))
+            if length > MAX_BODY_BYTES:
+                await self._respond(writer, 413, {'error': 'Request body too large'})
+                return
+            body = await reader.readexactly(length) if length else b''
+            await self._route(method, path.split('?', 1)[0].rstrip('/'), body, writer)
+        except (ValueError, asyncio.IncompleteReadError):
+            await self._respond(writer, 400, {'error': 'Malformed request'})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body, writer):
+        parts = path.strip('/').split('/')
+        if parts == ['stats'] and method == 'GET':
+            await self._respond(writer, 200, self.stats())
+            return
+        if parts[0] != 'jobs' or len(parts) > 3:
+            await self._respond(writer, 404, {'error': f"No route for {path}"})
+            return
+
+        if len(parts) == 1:
+            if method == 'GET':
+                await self._respond(writer, 200, [job.to_dict() for job in self.jobs.values()])
+            elif method == 'POST':
+                try:
+                    request = json.loads(body or b'{}')
+                    job = self.submit(request.get('config'), request.get('num_rounds'),
+                                      request.get('seed'), request.get('progress_rounds'))
+                except (ValueError, TypeError, AttributeError, KeyError) as e:
+                    await self._respond(writer, 400, {'error': str(e)})
+                    return
+                await self._respond(writer, 202, job.to_dict())
+            else:
+                await self._respond(writer, 405, {'error': f"{method} not allowed on /jobs"})
+            return
+
+        job = self.jobs.get(parts[1])
+        if job is None:
+            await self._respond(writer, 404, {'error': f"No job {parts[1]}"})
+        elif len(parts) == 3 and parts[2] == 'events' and method == 'GET':
+            await self._stream(job, writer)
+        elif len(parts) == 2 and method == 'GET':
+            await self._respond(writer, 200, job.to_dict())
+        elif len(parts) == 2 and method == 'DELETE':
+            await self._respond(writer, 202, self.cancel(job.id).to_dict())
+        else:
+            await self._respond(writer, 405, {'error': f"{method} not allowed on {path}"})
+
+    async def _respond(self, writer, status, payload):
+        body = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+
+    async def _stream(self, job, writer):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        await writer.drain()
+        events = self.events(job)
+        try:
+            async for event, data in events:
+                writer.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+                await writer.drain()
+        finally:
+            # Unsubscribes at once when the client goes away mid-stream
+            await events.aclose()
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        """Runs the service on ``host:port`` until cancelled."""
+        await self.start()
+        server = await asyncio.start_server(self.handle, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+
+def main():
+    import argparse
+    import yaml
+
+    parser = argparse.ArgumentParser(description='Serve simulation jobs over HTTP on localhost.')
+    parser.add_argument('-c', '--config', type=str, default='config.yaml',
+                        help='Base configuration that job configs are merged over')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--max-concurrent', type=int, default=2,
+                        help='Jobs run at once, one worker process each (default: 2)')
+    parser.add_argument('--cache-size', type=int, default=128, help='Cached results of seeded jobs')
+    parser.add_argument('--progress-rounds', type=int, default=1000,
+                        help='Default rounds between progress events')
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        config = yaml.safe_load(f)
+    service = SimulationService(config, max_concurrent=args.max_concurrent,
+                                cache_size=args.cache_size, progress_rounds=args.progress_rounds)
+    print(f"Serving simulation jobs on http://{args.host}:{args.port}/jobs")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+import copy
+import csv
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .blackjack import create_game
+from .parallel import summarize_players
+from ..utils.aggregation import COUNT_KEYS
+from ..utils.sinks import AggregateSink
+
+# Bump when a change to the game or to config_hash makes cached results stale
+SWEEP_CACHE_VERSION = 2
+# Simulation settings that never change a run's results; every other setting,
+# such as adaptive or outcome_cache, is part of its config_hash
+RESULT_NEUTRAL_SETTINGS = (
+    'num_rounds', 'verbose', 'output_dir', 'record_sink', 'chunk_rounds', 'export_format',
+    'excel_summary', 'pooled', 'checkpoint_every', 'compile_strategies', 'variance_reduction',
+)
+RESULT_KEYS = COUNT_KEYS + ('bet_sum', 'net_result', 'net_mean', 'net_std')
+
+
+def expand_grid(config):
+    """Returns ``(params, cell_config)`` for every cell of ``config['sweep']['grid']``.
+
+    The grid maps dotted config paths, such as
+    ``strategies.AggressiveStrategy.max_bet_percentage`` or
+    ``game.minimum_bet``, to lists of values; cells are their cartesian
+    product, in grid order with the last path varying fastest.
+    """
+    grid = config['sweep']['grid']
+    paths = list(grid)
+    base = {key: value for key, value in config.items() if key != 'sweep'}
+    cells = []
+    for values in itertools.product(*(grid[path] for path in paths)):
+        cell_config = copy.deepcopy(base)
+        for path, value in zip(paths, values):
+            *parents, leaf = path.split('.')
+            section = cell_config
+            for key in parents:
+                section = section.setdefault(key, {})
+            section[leaf] = value
+        cells.append((dict(zip(paths, values)), cell_config))
+    return cells
+
+
+def config_hash(config, num_rounds, seed):
+    """Returns a stable hash of everything that determines a run's results.
+
+    That is the whole config except its ``sweep`` section and the
+    ``RESULT_NEUTRAL_SETTINGS`` of ``simulation``, plus the round count and
+    seed. Shared by the sweep's cell cache and the service's result cache.
+    """
+    simulation = {
+        key: value for key, value in config.get('simulation', {}).items()
+        if key not in RESULT_NEUTRAL_SETTINGS
+    }
+    key = {
+        'version': SWEEP_CACHE_VERSION,
+        'config': {**{k: v for k, v in config.items() if k != 'sweep'}, 'simulation': simulation},
+        'num_rounds': num_rounds,
+        'seed': seed,
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _run_cell(config, num_rounds, seed):
+    """Plays one cell and returns its per-player summaries."""
+    game = create_game(config, verbose=False, seed=seed, sink=AggregateSink())
+    initial_budgets = {player.name: player.budget for player in game.players}
+    game.run_simulation(num_rounds)
+    players = summarize_players(game, initial_budgets)
+    for name, summary in players.items():
+        aggregate = game.record_sink.aggregator.player(name)
+        summary.update({
+            'bet_sum': aggregate.bet_sum,
+            'net_mean': aggregate.net_mean,
+            'net_std': aggregate.net_variance ** 0.5,
+        })
+    return list(players.values())
+
+
+def _load_cached(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached(path, players):
+    # Write then rename, so an interrupted sweep never leaves a torn entry
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(players, f)
+    os.replace(tmp_path, path)
+
+
+def run_sweep(config, workers=1, seed=None):
+    """Plays every cell of the sweep grid and returns one tidy row per cell and player.
+
+    All cells deal from the same seed, so they see the same sequence of
+    shoes (common random numbers) and differences between cells reflect
+    the parameters rather than the cards. Cell results are cached as JSON
+    under ``sweep.cache_dir`` keyed by ``config_hash``; cells already in
+    the cache are not replayed. Missing cells run on a pool of
+    ``workers`` processes.
+    """
+    sweep = config['sweep']
+    num_rounds = sweep.get('num_rounds', config['simulation']['num_rounds'])
+    cache_dir = sweep.get('cache_dir', os.path.join(config['simulation']['output_dir'], 'sweep_cache'))
+    os.makedirs(cache_dir, exist_ok=True)
+    if seed is None:
+        seed = sweep.get('seed')
+    # Fix the entropy here so every cell, in any worker, shares the same shoes
+    seed = int(np.random.SeedSequence(seed).entropy)
+
+    cells = expand_grid(config)
+    hashes = [config_hash(cell_config, num_rounds, seed) for _, cell_config in cells]
+    paths = [os.path.join(cache_dir, f"{cell_hash}.json") for cell_hash in hashes]
+    results = [_load_cached(path) for path in paths]
+    cached = [result is not None for result in results]
+    missing = [index for index, result in enumerate(results) if result is None]
+
+    if workers <= 1 or len(missing) <= 1:
+        for index in missing:
+            results[index] = _run_cell(cells[index][1], num_rounds, seed)
+            _store_cached(paths[index], results[index])
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+            futures = {
+                index: executor.submit(_run_cell, cells[index][1], num_rounds, seed)
+                for index in missing
+            }
+            for index, future in futures.items():
+                results[index] = future.result()
+                _store_cached(paths[index], results[index])
+
+    rows = []
+    for index, ((params, _), players) in enumerate(zip(cells, results)):
+        for player in players:
+            row = {'cell': index, 'config_hash': hashes[index], **params,
+                   'player': player['name'], 'strategy': player['strategy']}
+            row.update({key: player[key] for key in RESULT_KEYS})
+            row['cached'] = cached[index]
+            rows.append(row)
+    return rows
+
+
+def write_sweep_results(rows, output_dir, filename='sweep_results.csv'):
+    """Writes the rows from ``run_sweep`` to a CSV file in ``output_dir`` and returns its path."""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, filename)
+    fieldnames = list(rows[0]) if rows else []
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
@@ -0,0 +1,206 @@
+import math
+
+import numpy as np
+
+from .card import CARD_VALUES
+from .blackjack import MAX_DECISIONS_PER_HAND
+from .player import MAX_HANDS
+from ..strategies.decision_table import STAND, HIT, DOUBLE_DOWN, SPLIT, MAX_TOTAL
+
+# Hand results, as stored in the per-hand result array.
+PENDING, WIN, LOSE, PUSH = range(4)
+
+
+class VectorizedSimulator:
+    """Plays millions of independent rounds of a fixed-policy strategy as NumPy batches.
+
+    One seat is simulated per run. The rules mirror ``Game``: blackjack pays
+    3:2, the dealer stands on all 17s, a pair may be split up to
+    ``MAX_HANDS`` hands (split aces can't be split again), and a hand is
+    forced to stand after ``MAX_DECISIONS_PER_HAND`` decisions. Each round
+    is dealt from its own freshly shuffled shoe and the bankroll is
+    unlimited, so every split or double down is affordable.
+    """
+
+    def __init__(self, table, rules=None, name=None):
+        rules = rules or {}
+        self.table = table
+        self.name = name or table.name
+        self.num_decks = rules.get('num_decks', 6)
+        self.minimum_bet = rules.get('minimum_bet', 10)
+        # Number of cards of each value 2..11 in a full shoe
+        self._composition = np.bincount(
+            np.array(CARD_VALUES, dtype=np.intp) - 2, minlength=10
+        ).astype(np.int16) * self.num_decks
+
+    def run(self, num_rounds, seed=None, chunk_size=100_000):
+        """Simulates ``num_rounds`` rounds and returns per-player statistics.
+
+        The counts use the same keys as ``BlackjackAnalytics.generate_summary_report``;
+        ``house_edge`` is the expected loss per unit of initial bet and
+        ``house_edge_ci`` its 95% confidence interval.
+        """
+        rng = np.random.default_rng(seed)
+        totals = dict.fromkeys(
+            ['total_hands', 'wins', 'losses', 'pushes', 'blackjacks', 'busts'], 0
+        )
+        net_sum = 0.0
+        net_sq_sum = 0.0
+
+        for start in range(0, num_rounds, chunk_size):
+            counts, net = self._play_chunk(min(chunk_size, num_rounds - start), rng)
+            for key, value in counts.items():
+                totals[key] += value
+            net_sum += float(net.sum())
+            net_sq_sum += float(np.square(net).sum())
+
+        mean = net_sum / num_rounds if num_rounds else 0.0
+        variance = net_sq_sum / num_rounds - mean ** 2 if num_rounds else 0.0
+        half_width = 1.96 * math.sqrt(max(variance, 0.0) / num_rounds) if num_rounds else 0.0
+
+        return {
+            'name': self.name,
+            'rounds': num_rounds,
+            **totals,
+            'net_result': net_sum * self.minimum_bet,
+            'house_edge': -mean,
+            'house_edge_ci': (-mean - half_width, -mean + half_width),
+        }
+
+    def _play_chunk(self, num_rounds, rng):
+        """Plays one batch of rounds; returns result counts and net units per round."""
+        shape = (num_rounds, MAX_HANDS)
+        rows = np.arange(num_rounds)
+        # Cards are drawn lazily without replacement from each round's shoe
+        # composition, which is equivalent to dealing off a shuffled shoe.
+        shoes = np.tile(self._composition, (num_rounds, 1))
+        remaining = np.full(num_rounds, int(self._composition.sum()))
+
+        hard = np.zeros(shape, dtype=np.int16)
+        aces = np.zeros(shape, dtype=np.int8)
+        num_cards = np.zeros(shape, dtype=np.int8)
+        first = np.zeros(shape, dtype=np.int8)
+        second = np.zeros(shape, dtype=np.int8)
+        bet = np.ones(shape, dtype=np.int8)
+        done = np.zeros(shape, dtype=bool)
+        ace_split = np.zeros(shape, dtype=bool)
+        decisions = np.zeros(shape, dtype=np.int8)
+        result = np.zeros(shape, dtype=np.int8)
+        num_hands = np.ones(num_rounds, dtype=np.int8)
+
+        def deal(idx):
+            draw = rng.integers(0, remaining[idx])
+            value_index = (shoes[idx].cumsum(axis=1) <= draw[:, None]).sum(axis=1)
+            shoes[idx, value_index] -= 1
+            remaining[idx] -= 1
+            return (value_index + 2).astype(np.int8)
+
+        def add_card(hard, aces, num_cards, first, second, idx, slot, card):
+            is_ace = card == 11
+            count = num_cards[idx, slot]
+            hard[idx, slot] += np.where(is_ace, 1, card)
+            aces[idx, slot] += is_ace
+            first[idx, slot] = np.where(count == 0, card, first[idx, slot])
+            second[idx, slot] = np.where(count == 1, card, second[idx, slot])
+            num_cards[idx, slot] = count + 1
+
+        def hand_value(hard, aces, idx, slot):
+            total = hard[idx, slot]
+            soft = (aces[idx, slot] > 0) & (total <= 11)
+            return total + 10 * soft, soft
+
+        player = (hard, aces, num_cards, first, second)
+        dealer = tuple(np.zeros((num_rounds, 1), dtype=array.dtype) for array in player)
+
+        # Initial deal: two cards to the player, then two to the dealer
+        add_card(*player, rows, 0, deal(rows))
+        add_card(*player, rows, 0, deal(rows))
+        add_card(*dealer, rows, 0, deal(rows))
+        add_card(*dealer, rows, 0, deal(rows))
+        up_card = dealer[3][:, 0]
+        # The bankroll is unlimited, so every hand reads the can_afford layer
+        actions = self.table.actions[1]
+
+        for slot in range(MAX_HANDS):
+            while True:
+                idx = np.flatnonzero(
+                    (num_hands > slot) & ~done[:, slot] & (decisions[:, slot] < MAX_DECISIONS_PER_HAND)
+                )
+                if not idx.size:
+                    break
+
+                value, soft = hand_value(hard, aces, idx, slot)
+                is_pair = (num_cards[idx, slot] == 2) & (first[idx, slot] == second[idx, slot])
+                pair_value = np.where(is_pair, first[idx, slot], 0)
+                action = actions[pair_value, soft.astype(np.intp), np.minimum(value, MAX_TOTAL), up_card[idx]]
+                decisions[idx, slot] += 1
+
+                done[idx[action == STAND], slot] = True
+
+                hit = idx[action == HIT]
+                add_card(*player, hit, slot, deal(hit))
+
+                double = idx[action == DOUBLE_DOWN]
+                bet[double, slot] = 2
+                add_card(*player, double, slot, deal(double))
+                done[double, slot] = True
+
+                drawn = np.concatenate([hit, double])
+                busted = drawn[hand_value(hard, aces, drawn, slot)[0] > 21]
+                done[busted, slot] = True
+                result[busted, slot] = LOSE
+
+                # A refused split still uses up a decision, as in Player.split_hand
+                split_mask = (action == SPLIT) & is_pair
+                split = idx[split_mask]
+                split = split[(num_hands[split] < MAX_HANDS) & ~ace_split[split, slot]]
+                if split.size:
+                    target = num_hands[split].astype(np.intp)
+                    num_hands[split] += 1
+                    moved = second[split, slot]
+                    is_ace_pair = first[split, slot] == 11
+
+                    hard[split, slot] -= np.where(moved == 11, 1, moved)
+                    aces[split, slot] -= moved == 11
+                    num_cards[split, slot] = 1
+                    add_card(*player, split, target, moved)
+                    add_card(*player, split, target, deal(split))
+                    add_card(*player, split, slot, deal(split))
+                    ace_split[split, slot] |= is_ace_pair
+                    ace_split[split, target] = is_ace_pair
+
+        # Dealer hits until reaching 17 or more
+        while True:
+            idx = np.flatnonzero(hand_value(dealer[0], dealer[1], rows, 0)[0] < 17)
+            if not idx.size:
+                break
+            add_card(*dealer, idx, 0, deal(idx))
+
+        dealer_value = hand_value(dealer[0], dealer[1], rows, 0)[0]
+        dealer_bust = dealer_value > 21
+
+        counts = dict.fromkeys(['total_hands', 'wins', 'losses', 'pushes', 'blackjacks', 'busts'], 0)
+        net = np.zeros(num_rounds)
+        for slot in range(MAX_HANDS):
+            exists = num_hands > slot
+            value = hand_value(hard, aces, rows, slot)[0]
+            blackjack = exists & (num_cards[:, slot] == 2) & (value == 21)
+            pending = exists & (result[:, slot] == PENDING)
+
+            hand_result = result[:, slot]
+            hand_result[pending & (blackjack | dealer_bust | (value > dealer_value))] = WIN
+            hand_result[pending & ~blackjack & ~dealer_bust & (value < dealer_value)] = LOSE
+            hand_result[pending & ~blackjack & ~dealer_bust & (value == dealer_value)] = PUSH
+
+            stake = bet[:, slot]
+            net += np.where(hand_result == WIN, np.where(blackjack, 1.5, 1.0) * stake, 0.0)
+            net -= np.where(exists & (hand_result == LOSE), stake, 0)
+
+            counts['total_hands'] += int(exists.sum())
+            counts['wins'] += int((exists & (hand_result == WIN)).sum())
+            counts['losses'] += int((exists & (hand_result == LOSE)).sum())
+            counts['pushes'] += int((exists & (hand_result == PUSH)).sum())
+            counts['blackjacks'] += int((blackjack & (hand_result == WIN)).sum())
+            counts['busts'] += int((exists & (value > 21)).sum())
+
+        return counts, net
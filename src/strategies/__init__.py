@@ -1,4 +1,26 @@
+from importlib import import_module
+
 from .base_strategy import BaseStrategy
-from .basic_strategy import BasicStrategy
-from .aggressive_strategy import AggressiveStrategy
-from .conservative_strategy import ConservativeStrategy
+
+# Everything else is imported on first access, so loading one strategy
+# doesn't load them all (OptimalStrategy brings in the EV solver).
+_LAZY_EXPORTS = {
+    'BasicStrategy': '.basic_strategy',
+    'AggressiveStrategy': '.aggressive_strategy',
+    'ConservativeStrategy': '.conservative_strategy',
+    'DecisionTable': '.decision_table',
+    'OptimalStrategy': '.optimal_strategy',
+    'CardCountingStrategy': '.card_counting',
+    'CompiledStrategy': '.compiler',
+    'compile_strategy': '.compiler',
+}
+
+__all__ = ['BaseStrategy', *_LAZY_EXPORTS]
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,6 @@
 from .base_strategy import BaseStrategy
 from src.utils.decorators import decision_modifier_decorator
+from src.game.card import CARD_VALUES, CARD_RANKS
 
 class AggressiveStrategy(BaseStrategy):
     """Aggressive betting and playing strategy."""
@@ -10,48 +11,57 @@ class AggressiveStrategy(BaseStrategy):
         self.description = "High-risk high-reward strategy with progressive betting"
         self.consecutive_wins = 0
         self.consecutive_losses = 0
+        self.max_bet_percentage = 0.25  # Maximum bet as a fraction of the budget
         
     def determine_bet(self, game, budget):
         """Progressive betting system."""
         base_bet = game.minimum_bet
+        if budget < base_bet:  # Sit out once the minimum bet can't be covered
+            return None
         if self.consecutive_wins > 0:
-            return min(base_bet * (2 ** self.consecutive_wins), budget * 0.25)
+            return max(base_bet, min(base_bet * (2 ** self.consecutive_wins), budget * self.max_bet_percentage))
         return base_bet
         
+    def record_result(self, hands):
+        """Tracks winning and losing streaks for the progressive bet."""
+        results = [hand.result for hand in hands]
+        if "win" in results:
+            self.consecutive_wins += 1
+            self.consecutive_losses = 0
+        elif "lose" in results:
+            self.consecutive_losses += 1
+            self.consecutive_wins = 0
+        
     @decision_modifier_decorator
     def decide(self, player_hand, game, budget):
         """Aggressive playing decisions."""
         player_value = player_hand.get_value()
-        dealer_up_card = game.dealer.hand.cards[0].blackjack_value()
-        
-        # Track the reason for the decision
-        reason = ""
-        decision = None
+        dealer_up_card = game.dealer.up_card_value()
         
         # Only split if we have fewer than 4 hands total and it makes strategic sense
         if player_hand.can_split() and budget >= player_hand.bet and len(game.players[0].hands) < 4:
-            card_value = player_hand.cards[0].blackjack_value()
+            card_value = CARD_VALUES[player_hand.cards[0]]
             if card_value in [8, 11]:  # Only split Aces and 8s
-                decision = "split"
-                reason = f"Splitting pair of {player_hand.cards[0].rank}s (Aggressive strategy splits Aces and 8s)"
-            elif card_value <= 7:  # Maybe split low cards against dealer's weak cards
-                if dealer_up_card <= 6:
-                    decision = "split"
-                    reason = f"Splitting pair of {player_hand.cards[0].rank}s against dealer's weak card"
+                return "split"
+            elif card_value <= 7 and dealer_up_card <= 6:  # Split low cards against dealer's weak cards
+                return "split"
         
-        # If we haven't decided to split, make hitting/standing decision
-        if not decision:
-            if player_value <= 16:
-                decision = "hit"
-                reason = f"Hitting on {player_value} (Aggressive strategy hits on 16 or lower)"
-            elif player_value == 17 and player_hand.is_soft:
-                decision = "hit"
-                reason = "Hitting on soft 17 (Aggressive strategy)"
-            else:
-                decision = "stand"
-                reason = f"Standing on {player_value}"
+        if player_value <= 16:
+            return "hit"
+        elif player_value == 17 and player_hand.is_soft:
+            return "hit"
+        return "stand"
         
-        if game.verbose:
-            print(f"Strategy reasoning: {reason}")
-            
-        return decision 
\ No newline at end of file
+    def explain_decision(self, decision, player_hand, dealer_up_card):
+        """Explains the reasoning behind a decision."""
+        player_value = player_hand.get_value()
+        if decision == "split":
+            rank = CARD_RANKS[player_hand.cards[0]]
+            if CARD_VALUES[player_hand.cards[0]] in [8, 11]:
+                return f"Splitting pair of {rank}s (Aggressive strategy splits Aces and 8s)"
+            return f"Splitting pair of {rank}s against dealer's weak card"
+        if decision == "hit":
+            if player_value <= 16:
+                return f"Hitting on {player_value} (Aggressive strategy hits on 16 or lower)"
+            return "Hitting on soft 17 (Aggressive strategy)"
+        return f"Standing on {player_value}"
\ No newline at end of file
@@ -3,6 +3,15 @@ from abc import ABC, abstractmethod
 class BaseStrategy(ABC):
     """Abstract base class for all betting strategies."""
     
+    # True if decide() depends only on the hand value, softness, pair, dealer
+    # up card and whether the budget covers another bet, so it can be
+    # compiled into a DecisionTable
+    compilable = True
+    # True if decide() depends on nothing else than the above and the shoe
+    # composition, so an OutcomeCache may answer its rounds by hand, up card
+    # and true-count bucket
+    cacheable = True
+    
     def __init__(self):
         self.decision_rule = None
         
@@ -16,6 +25,10 @@ class BaseStrategy(ABC):
         """Makes a decision for the current hand."""
         pass
 
+    def record_result(self, hands):
+        """Called with the player's settled hands after every round they played."""
+        pass
+
     def explain_decision(self, decision, player_hand, dealer_up_card):
         """Explains the reasoning behind a decision."""
         return f"Made decision '{decision}' with hand value {player_hand.get_value()} against dealer's {dealer_up_card}" 
\ No newline at end of file
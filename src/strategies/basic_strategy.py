@@ -1,6 +1,7 @@
 import math
 from .base_strategy import BaseStrategy
 from ..utils.decorators import decision_modifier_decorator
+from ..game.card import CARD_VALUES
 
 class BasicStrategy(BaseStrategy):
     """Conservative basic strategy following standard blackjack rules."""
@@ -18,10 +19,10 @@ class BasicStrategy(BaseStrategy):
     def decide(self, player_hand, game, budget):
         """Standard basic strategy decisions."""
         player_value = player_hand.get_value()
-        dealer_up_card = game.dealer.hand.cards[0].blackjack_value()
+        dealer_up_card = game.dealer.up_card_value()
         
         if player_hand.can_split() and budget >= player_hand.bet:
-            if player_hand.cards[0].blackjack_value() in [8, 11]:  # Split 8s and Aces
+            if CARD_VALUES[player_hand.cards[0]] in [8, 11]:  # Split 8s and Aces
                 return "split"
                 
         if player_hand.is_soft:  # Hand with Ace counted as 11
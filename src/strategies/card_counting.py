@@ -1,12 +1,76 @@
+import math
 from .base_strategy import BaseStrategy
-from ..utils.decorators import decision_modifier_decorator
+from .optimal_strategy import OptimalStrategy
+from ..game.card import CARD_VALUES
+
+# Index plays (Illustrious 18 without insurance and surrender, stand on soft 17).
+# (pair value, hard total, dealer up card) -> (true count, action at or above it, action below it)
+INDEX_PLAYS = {
+    (0, 16, 10): (0, "stand", "hit"),
+    (0, 15, 10): (4, "stand", "hit"),
+    (10, 20, 5): (5, "split", "stand"),
+    (10, 20, 6): (4, "split", "stand"),
+    (0, 10, 10): (4, "double down", "hit"),
+    (0, 12, 3): (2, "stand", "hit"),
+    (0, 12, 2): (3, "stand", "hit"),
+    (0, 11, 11): (1, "double down", "hit"),
+    (0, 9, 2): (1, "double down", "hit"),
+    (0, 10, 11): (4, "double down", "hit"),
+    (0, 9, 7): (3, "double down", "hit"),
+    (0, 16, 9): (5, "stand", "hit"),
+    (0, 13, 2): (-1, "stand", "hit"),
+    (0, 12, 4): (0, "stand", "hit"),
+    (0, 12, 5): (-2, "stand", "hit"),
+    (0, 12, 6): (-1, "stand", "hit"),
+    (0, 13, 3): (-2, "stand", "hit"),
+}
+
 
 class CardCountingStrategy(BaseStrategy):
-    def __init__(self):
+    """Basic strategy with a true-count bet ramp and index-play deviations.
+
+    Basic strategy comes from the solved OptimalStrategy table; the true
+    count is read from the shoe in O(1) with whichever counting system the
+    Game was set up with. Index thresholds are Hi-Lo values.
+    """
+
+    compilable = False  # Decisions depend on the count
+
+    def __init__(self, bet_spread=8, max_bet_percentage=0.1, use_index_plays=True):
         super().__init__()
-        
+        self.name = "Card Counting Strategy"
+        self.description = "Basic strategy with true-count bet ramp and index plays"
+        self.bet_spread = bet_spread
+        self.max_bet_percentage = max_bet_percentage
+        self.use_index_plays = use_index_plays
+        self.basic_strategy = OptimalStrategy()
+        self.rule = f"Strategy: {self.name}"
+        self.index_rules = {
+            key: f"Index play: {'10,10' if key[0] else key[1]} vs {key[2]} at true count {threshold:+d}"
+            for key, (threshold, _, _) in INDEX_PLAYS.items()
+        }
+
     def determine_bet(self, game, budget):
-        true_count = game.deck.counter.count / 5  # Approximate decks remaining
-        if true_count > 2:
-            return min(budget * 0.1, game.minimum_bet * 2)
-        return game.minimum_bet 
\ No newline at end of file
+        """Bets one unit per true count above +1, up to ``bet_spread`` units."""
+        units = min(max(math.floor(game.deck.true_count()) - 1, 1), self.bet_spread)
+        if units == 1:
+            return game.minimum_bet
+        return max(game.minimum_bet, min(game.minimum_bet * units, budget * self.max_bet_percentage))
+
+    def decide(self, player_hand, game, budget):
+        """Plays basic strategy unless an index play applies at the current true count."""
+        if self.use_index_plays and not player_hand.is_soft:
+            pair_value = CARD_VALUES[player_hand.cards[0]] if player_hand.can_split() else 0
+            key = (pair_value, player_hand.get_value(), game.dealer.up_card_value())
+            index_play = INDEX_PLAYS.get(key)
+            if index_play:
+                threshold, above, below = index_play
+                decision = above if game.deck.true_count() >= threshold else below
+                if decision == "double down" and not (len(player_hand.cards) == 2 and budget >= player_hand.bet):
+                    decision = "hit"
+                elif decision == "split" and not (budget >= player_hand.bet
+                                                  and OptimalStrategy.can_split(player_hand, game)):
+                    decision = "stand"
+                return decision, self.index_rules[key]
+
+        return self.basic_strategy.decide(player_hand, game, budget)[0], self.rule
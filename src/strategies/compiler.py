@@ -0,0 +1,188 @@
+import copy
+from itertools import combinations_with_replacement
+
+import numpy as np
+
+from .base_strategy import BaseStrategy
+from .decision_table import ACTION_CODES, ACTIONS, MAX_TOTAL, NUM_VALUES, DecisionTable
+from ..game.card import CARD_VALUES
+from ..game.dealer import Dealer
+from ..game.hand import Hand
+from ..game.player import Player
+
+PROBE_BET = 10
+# One card code for each value 2..11, used to build probe hands
+VALUE_CODES = {value: CARD_VALUES.index(value) for value in range(2, NUM_VALUES)}
+
+
+def _table_index(hand, can_afford):
+    """Returns the table cell (without up card) a hand falls into."""
+    pair_value = CARD_VALUES[hand.cards[0]] if hand.can_split() else 0
+    return int(can_afford), pair_value, int(hand.is_soft), min(hand.get_value(), MAX_TOTAL)
+
+
+def probe_hands(max_cards=3):
+    """Returns ``{cell: [hand values, ...]}`` for every two- to ``max_cards``-card hand of 21 or less.
+
+    ``cell`` is ``(pair_value, is_soft, total)``; realizations are listed
+    fewest cards first.
+    """
+    cells = {}
+    for num_cards in range(2, max_cards + 1):
+        for values in combinations_with_replacement(range(2, NUM_VALUES), num_cards):
+            hand = _build_hand(values)
+            if hand.is_bust():
+                continue
+            _, pair_value, is_soft, total = _table_index(hand, False)
+            cells.setdefault((pair_value, is_soft, total), []).append(values)
+    return cells
+
+
+def _build_hand(values):
+    hand = Hand()
+    hand.bet = PROBE_BET
+    for value in values:
+        hand.add_card(VALUE_CODES[value])
+    return hand
+
+
+class _ProbeGame:
+    """The parts of a Game a stateless strategy reads while deciding."""
+
+    def __init__(self, strategy):
+        self.verbose = False
+        self.minimum_bet = PROBE_BET
+        self.dealer = Dealer()
+        self.player = Player("Probe", 0, strategy)
+        self.player.game = self
+        self.players = [self.player]
+
+    def decide(self, values, up_card, can_afford):
+        """Returns the strategy's (decision, rule) for one hand and up card."""
+        hand = _build_hand(values)
+        self.player.hands = [hand]
+        self.dealer.reset_hand()
+        self.dealer.hand.add_card(VALUE_CODES[up_card])
+        self.dealer.hand.add_card(VALUE_CODES[10])
+        budget = PROBE_BET if can_afford else PROBE_BET - 1
+        return self.player.strategy.decide(hand, self, budget)
+
+
+def compile_table(strategy, name=None):
+    """Probes ``strategy.decide`` over every table cell and returns the resulting DecisionTable.
+
+    Each reachable cell is decided once, using its fewest-card hand.
+    Unreachable cells are left as stand.
+    """
+    if not strategy.compilable:
+        raise ValueError(f"{strategy.name} depends on game state and can't be compiled")
+
+    game = _ProbeGame(strategy)
+    actions = np.zeros(DecisionTable.SHAPE, dtype=np.uint8)
+    labels = np.zeros(DecisionTable.SHAPE, dtype=np.uint8)
+    rules = {}
+    for (pair_value, is_soft, total), realizations in probe_hands().items():
+        for can_afford in (0, 1):
+            for up_card in range(2, NUM_VALUES):
+                decision, rule = game.decide(realizations[0], up_card, can_afford)
+                cell = (can_afford, pair_value, is_soft, total, up_card)
+                actions[cell] = ACTION_CODES[decision]
+                labels[cell] = rules.setdefault(rule, len(rules))
+    return DecisionTable(actions, name=name or strategy.name, rules=rules, labels=labels)
+
+
+def verify_equivalence(strategy, table):
+    """Replays every probe hand through ``strategy`` and ``table``.
+
+    Returns a list of ``(hand values, up card, can_afford, expected,
+    compiled)`` for each disagreement; an empty list means the table is
+    equivalent to the strategy on every hand of up to three cards.
+    """
+    game = _ProbeGame(strategy)
+    mismatches = []
+    for (pair_value, is_soft, total), realizations in probe_hands().items():
+        for values in realizations:
+            for can_afford in (0, 1):
+                for up_card in range(2, NUM_VALUES):
+                    expected = game.decide(values, up_card, can_afford)
+                    cell = (can_afford, pair_value, is_soft, total, up_card)
+                    compiled = (ACTIONS[table.actions[cell]], table.rules[table.labels[cell]])
+                    if expected != compiled:
+                        mismatches.append((values, up_card, bool(can_afford), expected, compiled))
+    return mismatches
+
+
+class CompiledStrategy(BaseStrategy):
+    """Plays a stateless strategy's decisions from its compiled table in O(1).
+
+    Betting is still delegated to the original strategy.
+    """
+
+    compilable = False
+
+    def __init__(self, strategy, table=None):
+        super().__init__()
+        self.strategy = strategy
+        self.name = strategy.name
+        self.description = strategy.description
+        self.table = table if table is not None else compile_table(strategy)
+        # (decision, rule) pairs are built once; decide() only indexes them
+        outcomes = {}
+        codes = np.zeros(DecisionTable.SHAPE, dtype=np.intp)
+        for cell in np.ndindex(*DecisionTable.SHAPE):
+            outcome = (ACTIONS[self.table.actions[cell]], self.table.rules[self.table.labels[cell]])
+            codes[cell] = outcomes.setdefault(outcome, len(outcomes))
+        self._outcomes = tuple(outcomes)
+        self._codes = codes.tolist()
+
+    def record_result(self, hands):
+        """Passes round results on to the original strategy."""
+        self.strategy.record_result(hands)
+
+    def for_strategy(self, strategy):
+        """Returns a CompiledStrategy for another instance of the same strategy, sharing this table.
+
+        Only valid when ``strategy`` decides exactly like the one compiled,
+        e.g. a second player with the same strategy and parameters.
+        """
+        compiled = copy.copy(self)
+        compiled.strategy = strategy
+        return compiled
+
+    def determine_bet(self, game, budget):
+        """Delegates betting to the original strategy."""
+        return self.strategy.determine_bet(game, budget)
+
+    def explain_decision(self, decision, player_hand, dealer_up_card):
+        """Explains a decision the way the original strategy would."""
+        return self.strategy.explain_decision(decision, player_hand, dealer_up_card)
+
+    def decide(self, player_hand, game, budget):
+        """Looks up the compiled (decision, rule) for the hand."""
+        cards = player_hand.cards
+        return self._outcomes[
+            self._codes[budget >= player_hand.bet]
+                       [CARD_VALUES[cards[0]] if player_hand.can_split() else 0]
+                       [player_hand.is_soft]
+                       [min(player_hand.get_value(), MAX_TOTAL)]
+                       [game.dealer.up_card_value()]
+        ]
+
+
+def compile_strategy(strategy, verify=True):
+    """Returns a CompiledStrategy for ``strategy``.
+
+    With ``verify``, the table is checked against the original strategy
+    first and a ValueError is raised if they disagree on any hand.
+    """
+    table = compile_table(strategy)
+    if verify:
+        mismatches = verify_equivalence(strategy, table)
+        if mismatches:
+            values, up_card, can_afford, expected, compiled = mismatches[0]
+            raise ValueError(
+                f"{strategy.name} is not equivalent to its compiled table "
+                f"({len(mismatches)} mismatches, e.g. hand {values} vs {up_card}: "
+                f"{expected} != {compiled})"
+            )
+    return CompiledStrategy(strategy, table)
@@ -8,10 +8,11 @@ class ConservativeStrategy(BaseStrategy):
         super().__init__()
         self.name = "Conservative Strategy"
         self.description = "Risk-averse strategy focusing on capital preservation"
+        self.min_budget_threshold = 20  # Minimum budget, in minimum bets, to keep playing
         
     def determine_bet(self, game, budget):
         """Minimal betting approach."""
-        if budget < game.minimum_bet * 20:  # Stop if low on funds
+        if budget < game.minimum_bet * self.min_budget_threshold:  # Stop if low on funds
             return None
         return game.minimum_bet
         
@@ -19,7 +20,7 @@ class ConservativeStrategy(BaseStrategy):
     def decide(self, player_hand, game, budget):
         """Conservative playing decisions."""
         player_value = player_hand.get_value()
-        dealer_up_card = game.dealer.hand.cards[0].blackjack_value()
+        dealer_up_card = game.dealer.up_card_value()
         
         # Never split
         if player_value >= 12:
@@ -0,0 +1,63 @@
+import numpy as np
+
+ACTIONS = ('stand', 'hit', 'double down', 'split')
+STAND, HIT, DOUBLE_DOWN, SPLIT = range(len(ACTIONS))
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# Card values run from 2 to 11 (ace); index 0 on the pair axis means "not a pair".
+NUM_VALUES = 12
+MAX_TOTAL = 21
+
+
+class DecisionTable:
+    """Dense lookup table of a fixed-policy strategy's decisions.
+
+    ``actions`` is a uint8 array of action codes indexed by
+    ``[can_afford, pair_value, is_soft, player_total, dealer_up_card]``.
+    ``pair_value`` is the card value of a splittable two-card hand or 0,
+    ``can_afford`` says whether the budget covers another bet (split or
+    double down).
+
+    ``labels`` optionally holds, per cell, an index into ``rules``: the rule
+    label the strategy reported alongside the action.
+    """
+
+    SHAPE = (2, NUM_VALUES, 2, MAX_TOTAL + 1, NUM_VALUES)
+
+    def __init__(self, actions, name=None, rules=None, labels=None):
+        actions = np.asarray(actions, dtype=np.uint8)
+        if actions.shape != self.SHAPE:
+            raise ValueError(f"Decision table must have shape {self.SHAPE}, got {actions.shape}")
+        self.actions = actions
+        self.name = name
+        self.rules = tuple(rules) if rules is not None else (f"Strategy: {name}",)
+        self.labels = (np.asarray(labels, dtype=np.uint8) if labels is not None
+                       else np.zeros(self.SHAPE, dtype=np.uint8))
+        if self.labels.shape != self.SHAPE:
+            raise ValueError(f"Rule labels must have shape {self.SHAPE}, got {self.labels.shape}")
+
+    @classmethod
+    def from_function(cls, decide, name=None):
+        """Builds a table from ``decide(total, is_soft, pair_value, dealer_up_card, can_afford)``.
+
+        ``decide`` returns one of ``ACTIONS`` and is called once per cell.
+        """
+        actions = np.zeros(cls.SHAPE, dtype=np.uint8)
+        for can_afford in (0, 1):
+            for pair_value in range(NUM_VALUES):
+                for is_soft in (0, 1):
+                    for total in range(MAX_TOTAL + 1):
+                        for up_card in range(2, NUM_VALUES):
+                            decision = decide(total, bool(is_soft), pair_value, up_card, bool(can_afford))
+                            actions[can_afford, pair_value, is_soft, total, up_card] = ACTION_CODES[decision]
+        return cls(actions, name=name)
+
+    def lookup(self, total, is_soft, pair_value, dealer_up_card, can_afford=True):
+        """Returns the action name for a single hand."""
+        code = self.actions[int(can_afford), pair_value, int(is_soft), min(total, MAX_TOTAL), dealer_up_card]
+        return ACTIONS[code]
+
+    def lookup_rule(self, total, is_soft, pair_value, dealer_up_card, can_afford=True):
+        """Returns the rule label for a single hand."""
+        label = self.labels[int(can_afford), pair_value, int(is_soft), min(total, MAX_TOTAL), dealer_up_card]
+        return self.rules[label]
@@ -0,0 +1,161 @@
+import numpy as np
+
+from ..game.dealer_odds import BUST, DEALER_STANDS_ON, dealer_distribution, full_shoe
+from .decision_table import ACTIONS, STAND, HIT, MAX_TOTAL, NUM_VALUES, DecisionTable
+
+BLACKJACK_PAYOUT = 1.5
+
+
+class ExpectedValues:
+    """Expected values of each action against one dealer up card.
+
+    Player draws are taken from the unseen composition with replacement,
+    the dealer's final total uses the exact distribution for that
+    composition. The settlement rules are Game's: a two-card 21 pays 3:2,
+    including after a split, a busted double down loses both bets, and a
+    hand may double down at any point, not only on its first two cards.
+    """
+
+    def __init__(self, unseen, up_card):
+        self.up_card = up_card
+        remaining = sum(unseen)
+        self.draw_probabilities = [count / remaining for count in unseen]
+        dealer = dealer_distribution(up_card, unseen)
+
+        # stand[t]: EV of standing on value t (anything below 17 only wins on a bust)
+        self.stand = [0.0] * (MAX_TOTAL + 1)
+        for total in range(MAX_TOTAL + 1):
+            ev = dealer[BUST]
+            for index, p in enumerate(dealer[:BUST]):
+                dealer_total = DEALER_STANDS_ON + index
+                if dealer_total < total:
+                    ev += p
+                elif dealer_total > total:
+                    ev -= p
+            self.stand[total] = ev
+        self._hit = {}
+
+    @staticmethod
+    def value(hard_total, has_ace):
+        """Returns (value, is_soft) for a hard total and ace flag."""
+        if has_ace and hard_total <= 11:
+            return hard_total + 10, True
+        return hard_total, False
+
+    @staticmethod
+    def state(total, is_soft):
+        """Returns the (hard_total, has_ace) state for a hand value."""
+        return (total - 10, True) if is_soft else (total, False)
+
+    def _draws(self, hard_total, has_ace):
+        """Yields (probability, hard_total, has_ace) for every next card."""
+        for index, p in enumerate(self.draw_probabilities):
+            if p:
+                card = index + 2
+                yield p, hard_total + (1 if card == 11 else card), has_ace or card == 11
+
+    def hit(self, hard_total, has_ace, can_double=False):
+        """EV of hitting, then playing the best of hit/stand, or of hit/stand/double if ``can_double``."""
+        key = (hard_total, has_ace, can_double)
+        if key not in self._hit:
+            ev = 0.0
+            for p, next_hard, next_ace in self._draws(hard_total, has_ace):
+                if next_hard > 21:
+                    ev -= p
+                    continue
+                best = max(self.stand[self.value(next_hard, next_ace)[0]],
+                           self.hit(next_hard, next_ace, can_double))
+                if can_double:
+                    best = max(best, self.double_down(next_hard, next_ace))
+                ev += p * best
+            self._hit[key] = ev
+        return self._hit[key]
+
+    def double_down(self, hard_total, has_ace):
+        """EV of doubling: one more card, then stand, at twice the bet."""
+        ev = 0.0
+        for p, next_hard, next_ace in self._draws(hard_total, has_ace):
+            ev += p * (-1.0 if next_hard > 21 else self.stand[self.value(next_hard, next_ace)[0]])
+        return 2 * ev
+
+    def split(self, pair_value):
+        """EV of splitting a pair of ``pair_value`` (no resplits), over both hands."""
+        card_hard = 1 if pair_value == 11 else pair_value
+        ev = 0.0
+        for p, hard_total, has_ace in self._draws(card_hard, pair_value == 11):
+            total = self.value(hard_total, has_ace)[0]
+            if total == 21:
+                ev += p * BLACKJACK_PAYOUT
+            else:
+                ev += p * max(self.stand[total], self.hit(hard_total, has_ace, True),
+                              self.double_down(hard_total, has_ace))
+        return 2 * ev
+
+    def action_values(self, total, is_soft, pair_value=0, can_double=True):
+        """Returns {action: EV} for a hand; doubling and splitting only if ``can_double``.
+
+        ``can_double`` means the budget covers another bet, so the hand may
+        also double down on any later card.
+        """
+        hard_total, has_ace = self.state(total, is_soft)
+        values = {
+            'stand': self.stand[total],
+            'hit': self.hit(hard_total, has_ace, can_double),
+        }
+        if can_double:
+            values['double down'] = self.double_down(hard_total, has_ace)
+            if pair_value:
+                values['split'] = self.split(pair_value)
+        return values
+
+
+def _best(values):
+    return ACTIONS.index(max(values, key=values.get))
+
+
+def solve_up_card(unseen, up_card):
+    """Returns the best action codes for one up card, indexed like ``DecisionTable.actions[..., up_card]``.
+
+    Layer 0 of the first axis is a hand that may only hit or stand because
+    the budget is short; layer 1 is a hand whose budget covers another bet,
+    which may also double down, or split if it is a pair. This is the
+    ``can_afford`` axis of ``DecisionTable``, as every engine reads it.
+    """
+    evs = ExpectedValues(unseen, up_card)
+    actions = np.full(DecisionTable.SHAPE[:-1], HIT, dtype=np.uint8)
+
+    for can_afford in (0, 1):
+        for is_soft in (0, 1):
+            for total in range(4, MAX_TOTAL + 1):
+                if is_soft and total < 12:
+                    continue
+                action = _best(evs.action_values(total, is_soft, can_double=bool(can_afford)))
+                actions[can_afford, :, is_soft, total] = action
+            if is_soft:  # Soft totals below 12 can't occur; play them as hard
+                actions[can_afford, :, 1, :12] = actions[can_afford, :, 0, :12]
+
+    for pair_value in range(2, NUM_VALUES):
+        total, is_soft = (12, 1) if pair_value == 11 else (2 * pair_value, 0)
+        actions[1, pair_value, is_soft, total] = _best(
+            evs.action_values(total, is_soft, pair_value=pair_value)
+        )
+    actions[:, :, :, :4] = HIT
+    actions[:, :, :, MAX_TOTAL] = STAND
+    return actions
+
+
+def solve_strategy_table(num_decks=6, unseen=None, name="Optimal Strategy"):
+    """Solves the total-dependent strategy for every up card of a shoe.
+
+    ``unseen`` defaults to a full shoe of ``num_decks`` decks; each up card
+    is removed from it before solving.
+    """
+    shoe = list(unseen if unseen is not None else full_shoe(num_decks))
+    actions = np.zeros(DecisionTable.SHAPE, dtype=np.uint8)
+    for up_card in range(2, NUM_VALUES):
+        composition = list(shoe)
+        composition[up_card - 2] -= 1
+        actions[..., up_card] = solve_up_card(tuple(composition), up_card)
+    # Up card slots 0 and 1 never occur
+    actions[..., :2] = STAND
+    return DecisionTable(actions, name=name)
@@ -1,11 +1,113 @@
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
 from .base_strategy import BaseStrategy
+from .decision_table import ACTIONS, DecisionTable
+from .ev_solver import BLACKJACK_PAYOUT, solve_strategy_table, solve_up_card
+from ..game.card import CARD_VALUES
+from ..game.dealer_odds import DEALER_STANDS_ON
+from ..game.player import MAX_HANDS
 from ..utils.decorators import decision_modifier_decorator
 
+TABLE_CACHE_DIR = Path(os.environ.get('BLACKJACK_CACHE_DIR', Path.home() / '.cache' / 'blackjack-simulator'))
+SOLVER_VERSION = 2  # Bump whenever a change to ev_solver changes the tables it solves
+
+
+def table_rules(num_decks):
+    """Returns the solver version and rules a solved table is only valid for."""
+    return {
+        'solver_version': SOLVER_VERSION,
+        'num_decks': num_decks,
+        'dealer_stands_on': DEALER_STANDS_ON,
+        'blackjack_payout': BLACKJACK_PAYOUT,
+        'max_hands': MAX_HANDS,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _composition_actions(unseen, up_card):
+    """Memoized composition-dependent actions for one up card."""
+    return solve_up_card(unseen, up_card)
+
+
+@lru_cache(maxsize=None)
+def _strategy_table(path, num_decks, name):
+    """Loads the solved table from ``path``, solving and saving it on first use.
+
+    The file records the ``table_rules`` it was solved for; a table solved
+    for other rules or by another solver version is solved again and
+    overwritten. Cached per process, so every OptimalStrategy shares one
+    read-only table.
+    """
+    path = Path(path)
+    rules = table_rules(num_decks)
+    try:
+        with np.load(path) as saved:
+            if json.loads(str(saved['rules'])) == rules:
+                return DecisionTable(saved['actions'], name=name)
+    except (OSError, ValueError, KeyError, AttributeError, TypeError):
+        pass  # Missing, unreadable or unversioned: solve it again
+    
+    table = solve_strategy_table(num_decks, name=name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, actions=table.actions, rules=json.dumps(rules, sort_keys=True))
+    except OSError:
+        pass  # A read-only cache only costs a re-solve next time
+    return table
+
+
 class OptimalStrategy(BaseStrategy):
-    def __init__(self):
+    """Expected-value maximizing strategy driven by a precomputed decision table."""
+    
+    compilable = False  # Already table-driven, and splitting depends on the hands in play
+    
+    def __init__(self, num_decks=6, table_path=None, composition_dependent=False):
         super().__init__()
+        self.name = "Optimal Strategy"
+        self.description = "Plays the highest expected-value action for every hand"
+        self.num_decks = num_decks
+        self.table_path = table_path
+        self.composition_dependent = composition_dependent
         self.load_strategy_table()
         
     def load_strategy_table(self):
-        # Load pre-calculated optimal strategy decisions
-        pass 
\ No newline at end of file
+        """Loads the solved decision table from disk, solving and saving it on first use."""
+        path = self.table_path or TABLE_CACHE_DIR / f"optimal_strategy_{self.num_decks}d_v{SOLVER_VERSION}.npz"
+        self.table = _strategy_table(str(path), self.num_decks, self.name)
+        
+    def determine_bet(self, game, budget):
+        """Consistent minimum betting."""
+        return game.minimum_bet
+        
+    @staticmethod
+    def can_split(player_hand, game):
+        """Returns True if Player.split_hand would actually split the hand."""
+        if player_hand.ace_split or not player_hand.can_split():
+            return False
+        return any(player_hand in player.hands and len(player.hands) < MAX_HANDS
+                   for player in game.players)
+        
+    @decision_modifier_decorator
+    def decide(self, player_hand, game, budget):
+        """Looks up the best action for the hand."""
+        if game.deck.num_decks != self.num_decks:
+            self.num_decks = game.deck.num_decks
+            self.load_strategy_table()
+        
+        up_card = game.dealer.up_card_value()
+        can_afford = budget >= player_hand.bet
+        pair_value = CARD_VALUES[player_hand.cards[0]] if can_afford and self.can_split(player_hand, game) else 0
+        index = (int(can_afford), pair_value, int(player_hand.is_soft), min(player_hand.get_value(), 21))
+        
+        if self.composition_dependent:
+            # The hole card is still unseen from the player's point of view
+            unseen = list(game.deck.composition())
+            unseen[CARD_VALUES[game.dealer.hand.cards[1]] - 2] += 1
+            return ACTIONS[_composition_actions(tuple(unseen), up_card)[index]]
+        return ACTIONS[self.table.actions[index + (up_card,)]]
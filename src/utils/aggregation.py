@@ -0,0 +1,139 @@
+from array import array
+
+COUNT_KEYS = ('total_hands', 'wins', 'losses', 'pushes', 'blackjacks', 'busts')
+
+
+class PlayerAggregate:
+    """Running statistics for one player, updated once per round."""
+
+    __slots__ = COUNT_KEYS + (
+        'bet_sum', 'largest_win', 'largest_loss', 'current_win_streak',
+        'max_win_streak', 'net_mean', 'net_m2', 'rounds_played',
+        'round_net_mean', 'round_net_m2', 'budget_history',
+    )
+
+    def __init__(self):
+        for key in COUNT_KEYS:
+            setattr(self, key, 0)
+        self.bet_sum = 0
+        self.largest_win = 0
+        self.largest_loss = 0
+        self.current_win_streak = 0
+        self.max_win_streak = 0
+        self.net_mean = 0.0  # Welford running mean/M2 of net result per hand
+        self.net_m2 = 0.0
+        self.rounds_played = 0  # Welford running mean/M2 of net result per round played
+        self.round_net_mean = 0.0
+        self.round_net_m2 = 0.0
+        self.budget_history = array('d')
+
+    def update(self, player):
+        """Folds the player's hands from the round just played into the totals."""
+        self.budget_history.append(player.budget)
+        won_round = False
+        round_net = 0
+
+        for hand in player.hands:
+            bet = hand.bet
+            self.total_hands += 1
+            self.bet_sum += bet
+
+            if hand.result == 'win':
+                self.wins += 1
+                won_round = True
+                if hand.is_blackjack():
+                    self.blackjacks += 1
+                    net = bet * 1.5
+                else:
+                    net = bet
+                if bet > self.largest_win:
+                    self.largest_win = bet
+            elif hand.result == 'lose':
+                self.losses += 1
+                net = -bet
+                if bet > self.largest_loss:
+                    self.largest_loss = bet
+            else:
+                self.pushes += 1
+                net = 0
+            if hand.is_bust():
+                self.busts += 1
+
+            delta = net - self.net_mean
+            self.net_mean += delta / self.total_hands
+            self.net_m2 += delta * (net - self.net_mean)
+            round_net += net
+
+        if player.hands:
+            self.rounds_played += 1
+            delta = round_net - self.round_net_mean
+            self.round_net_mean += delta / self.rounds_played
+            self.round_net_m2 += delta * (round_net - self.round_net_mean)
+
+        if won_round:
+            self.current_win_streak += 1
+            if self.current_win_streak > self.max_win_streak:
+                self.max_win_streak = self.current_win_streak
+        else:
+            self.current_win_streak = 0
+
+    def merge(self, other):
+        """Adds another aggregate's totals into this one (budget history excluded)."""
+        n_a, n_b = self.total_hands, other.total_hands
+        if n_b:
+            delta = other.net_mean - self.net_mean
+            total = n_a + n_b
+            self.net_mean += delta * n_b / total
+            self.net_m2 += other.net_m2 + delta * delta * n_a * n_b / total
+        n_a, n_b = self.rounds_played, other.rounds_played
+        if n_b:
+            delta = other.round_net_mean - self.round_net_mean
+            total = n_a + n_b
+            self.round_net_mean += delta * n_b / total
+            self.round_net_m2 += other.round_net_m2 + delta * delta * n_a * n_b / total
+            self.rounds_played = total
+        for key in COUNT_KEYS:
+            setattr(self, key, getattr(self, key) + getattr(other, key))
+        self.bet_sum += other.bet_sum
+        self.largest_win = max(self.largest_win, other.largest_win)
+        self.largest_loss = max(self.largest_loss, other.largest_loss)
+        self.max_win_streak = max(self.max_win_streak, other.max_win_streak)
+
+    @property
+    def net_variance(self):
+        """Sample variance of the net result per hand."""
+        return self.net_m2 / (self.total_hands - 1) if self.total_hands > 1 else 0.0
+
+    @property
+    def round_net_variance(self):
+        """Sample variance of the net result per round played."""
+        return self.round_net_m2 / (self.rounds_played - 1) if self.rounds_played > 1 else 0.0
+
+    def counts(self):
+        """Returns the result counts as a dictionary."""
+        return {key: getattr(self, key) for key in COUNT_KEYS}
+
+
+class OnlineAggregator:
+    """Per-player running statistics, fed once per round by a record sink."""
+
+    def __init__(self):
+        self.rounds = 0
+        self.players = {}
+        self.estimators = None  # VarianceEstimators fed alongside, if enabled
+
+    def update(self, game):
+        """Folds the round the game just played into every player's aggregate."""
+        self.rounds += 1
+        players = self.players
+        for player in game.players:
+            aggregate = players.get(player.name)
+            if aggregate is None:
+                aggregate = players[player.name] = PlayerAggregate()
+            aggregate.update(player)
+        if self.estimators is not None:
+            self.estimators.update(game)
+
+    def player(self, name):
+        """Returns the aggregate for ``name``, empty if the player never played."""
+        return self.players.get(name) or PlayerAggregate()
@@ -0,0 +1,188 @@
+import json
+from time import perf_counter_ns
+
+# Game methods timed as phases of start_game, in the order they run
+PHASES = (
+    '_reset_hands', '_check_deck', '_place_bets', '_deal_initial_cards',
+    '_play_hands', '_play_dealer_hand', '_settle_bets',
+)
+COUNTERS = ('rounds', 'decisions', 'splits', 'doubles', 'reshuffles', 'forced_end_hands')
+
+
+class LatencyHistogram:
+    """Latency histogram in power-of-two nanosecond buckets.
+
+    Bucket ``i`` holds samples of ``2**(i-1)`` up to ``2**i - 1`` ns.
+    """
+
+    __slots__ = ('buckets', 'count', 'total_ns')
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total_ns = 0
+
+    def add(self, ns):
+        self.buckets[ns.bit_length()] += 1
+        self.count += 1
+        self.total_ns += ns
+
+    def percentile(self, q):
+        """Returns the upper bound in ns of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return 0
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return 2 ** index - 1
+        return 2 ** (len(self.buckets) - 1)
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean_ns': self.total_ns / self.count if self.count else 0.0,
+            'p50_ns': self.percentile(0.5),
+            'p90_ns': self.percentile(0.9),
+            'p99_ns': self.percentile(0.99),
+            'buckets': {f"<{2 ** index}": count for index, count in enumerate(self.buckets) if count},
+        }
+
+
+class GameStats:
+    """Phase timers, event counters and decide() latencies collected by an instrumented Game."""
+
+    def __init__(self):
+        self.phase_ns = dict.fromkeys(PHASES + ('record',), 0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.decide_latency = {}  # strategy name -> LatencyHistogram
+
+    def to_dict(self):
+        return {
+            'phases_seconds': {phase: ns / 1e9 for phase, ns in self.phase_ns.items()},
+            'counters': dict(self.counters),
+            'decide_latency': {name: hist.to_dict() for name, hist in self.decide_latency.items()},
+        }
+
+    def dump_json(self, path):
+        """Writes the statistics to ``path`` as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def report(self):
+        """Returns a plain-text summary of the statistics."""
+        total = sum(self.phase_ns.values()) or 1
+        lines = ["Phase timings:"]
+        for phase, ns in self.phase_ns.items():
+            lines.append(f"  {phase.lstrip('_'):<20}{ns / 1e9:>10.3f}s {ns / total:>7.1%}")
+        lines.append("Counters:")
+        for name, value in self.counters.items():
+            lines.append(f"  {name:<20}{value:>10}")
+        lines.append("decide() latency:")
+        for name, hist in self.decide_latency.items():
+            summary = hist.to_dict()
+            lines.append(f"  {name:<24} mean {summary['mean_ns']:.0f}ns, p50 <{summary['p50_ns'] + 1}ns, "
+                         f"p99 <{summary['p99_ns'] + 1}ns over {summary['count']} calls")
+        return "\n".join(lines)
+
+
+def _timed(method, phase_ns, phase, after=None):
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        result = method(*args, **kwargs)
+        phase_ns[phase] += perf_counter_ns() - start
+        if after is not None:
+            after()
+        return result
+    return wrapper
+
+
+def _patch(installed, obj, name, wrapper):
+    setattr(obj, name, wrapper)
+    installed.append((obj, name))
+
+
+def instrument(game, stats=None):
+    """Installs timing and counting wrappers on ``game``, its players, strategies and deck.
+
+    Wrappers are set as instance attributes that shadow the class methods,
+    so an uninstrumented Game runs with no extra calls at all. Returns the
+    GameStats being filled in, a new one unless ``stats`` is given.
+    """
+    from ..game.blackjack import MAX_DECISIONS_PER_HAND
+
+    uninstrument(game)
+    stats = stats if stats is not None else GameStats()
+    counters = stats.counters
+    installed = []
+
+    def count_forced_ends():
+        for player in game.players:
+            for hand in player.hands:
+                if len(hand.decision_list) >= MAX_DECISIONS_PER_HAND:
+                    counters['forced_end_hands'] += 1
+
+    def count_round():
+        counters['rounds'] += 1
+
+    for phase in PHASES:
+        after = count_forced_ends if phase == '_play_hands' else None
+        _patch(installed, game, phase, _timed(getattr(game, phase), stats.phase_ns, phase, after))
+    _patch(installed, game.record_sink, 'record',
+           _timed(game.record_sink.record, stats.phase_ns, 'record', count_round))
+
+    deck_reset = game.deck.reset
+
+    def reset():
+        counters['reshuffles'] += 1
+        deck_reset()
+    _patch(installed, game.deck, 'reset', reset)
+
+    strategies = set()
+    for player in game.players:
+        _patch(installed, player, 'split_hand', _counted_split(player.split_hand, player, counters))
+        _patch(installed, player, 'double_down', _counted(player.double_down, counters, 'doubles'))
+        strategy = player.strategy
+        if id(strategy) in strategies:
+            continue
+        strategies.add(id(strategy))
+        histogram = stats.decide_latency.setdefault(strategy.name, LatencyHistogram())
+        _patch(installed, strategy, 'decide', _timed_decide(strategy.decide, histogram, counters))
+
+    game.stats = stats
+    game._instrumented = installed
+    return stats
+
+
+def uninstrument(game):
+    """Removes the wrappers installed by ``instrument``; the collected stats stay on ``game.stats``."""
+    for obj, name in reversed(getattr(game, '_instrumented', ())):
+        delattr(obj, name)
+    game._instrumented = []
+
+
+def _counted(method, counters, counter):
+    def wrapper(*args, **kwargs):
+        counters[counter] += 1
+        return method(*args, **kwargs)
+    return wrapper
+
+
+def _counted_split(split_hand, player, counters):
+    def wrapper(hand):
+        num_hands = len(player.hands)
+        split_hand(hand)
+        if len(player.hands) > num_hands:  # Refused splits don't count
+            counters['splits'] += 1
+    return wrapper
+
+
+def _timed_decide(decide, histogram, counters):
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        result = decide(*args, **kwargs)
+        histogram.add(perf_counter_ns() - start)
+        counters['decisions'] += 1
+        return result
+    return wrapper
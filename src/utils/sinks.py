@@ -0,0 +1,346 @@
+import math
+import os
+
+import numpy as np
+
+from src.game.card import CARD_NAMES
+from .aggregation import OnlineAggregator
+from .decorators import build_round_info
+
+# Flat, typed tables a round is split into: one row per round, one per player
+# per round and one per hand. Column name -> numpy dtype.
+TABLE_SCHEMAS = {
+    'rounds': {
+        'round_number': 'int64',
+        'dealer_cards': 'str',
+        'dealer_value': 'int8',
+        'dealer_bust': 'bool',
+        'cards_remaining': 'int32',
+        'cards_total_value': 'int32',
+        'running_count': 'int32',
+        'true_count': 'int32',
+    },
+    'players': {
+        'round_number': 'int64',
+        'player': 'str',
+        'budget': 'float64',
+    },
+    'hands': {
+        'round_number': 'int64',
+        'player': 'str',
+        'hand_index': 'int8',
+        'cards': 'str',
+        'decisions': 'str',
+        'bet': 'float64',
+        'value': 'int8',
+        'is_blackjack': 'bool',
+        'is_double_down': 'bool',
+        'is_ace_split': 'bool',
+        'is_bust': 'bool',
+        'result': 'str',
+    },
+}
+
+
+class ColumnTables:
+    """Builds the flat round, player and hand tables straight from a Game."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Drops all buffered rows."""
+        self.columns = {
+            table: {name: [] for name in schema} for table, schema in TABLE_SCHEMAS.items()
+        }
+        self.num_rounds = 0
+
+    def append(self, game):
+        """Appends the round the game just played."""
+        round_number = game.round_number
+        rounds, players, hands = (self.columns[t] for t in ('rounds', 'players', 'hands'))
+
+        dealer_hand = game.dealer.hand
+        rounds['round_number'].append(round_number)
+        rounds['dealer_cards'].append(', '.join(CARD_NAMES[card] for card in dealer_hand.cards))
+        rounds['dealer_value'].append(dealer_hand.get_value())
+        rounds['dealer_bust'].append(dealer_hand.is_bust())
+        rounds['cards_remaining'].append(game.deck.cards_remaining())
+        rounds['cards_total_value'].append(game.deck.total_deck_value())
+        rounds['running_count'].append(game.deck.counter.count)
+        rounds['true_count'].append(math.floor(game.deck.true_count()))
+
+        for player in game.players:
+            players['round_number'].append(round_number)
+            players['player'].append(player.name)
+            players['budget'].append(player.budget)
+
+            for hand_index, hand in enumerate(player.hands):
+                hands['round_number'].append(round_number)
+                hands['player'].append(player.name)
+                hands['hand_index'].append(hand_index)
+                hands['cards'].append(', '.join(CARD_NAMES[card] for card in hand.cards))
+                hands['decisions'].append(','.join(decision for decision, _ in hand.decision_list))
+                hands['bet'].append(hand.bet)
+                hands['value'].append(hand.get_value())
+                hands['is_blackjack'].append(hand.is_blackjack())
+                hands['is_double_down'].append(hand.is_double_down)
+                hands['is_ace_split'].append(hand.ace_split)
+                hands['is_bust'].append(hand.is_bust())
+                hands['result'].append(str(hand.result))
+
+        self.num_rounds += 1
+
+    def append_round_info(self, round_info):
+        """Appends a nested round record as built by ``build_round_info``."""
+        round_number = round_info['round number']
+        rounds, players, hands = (self.columns[t] for t in ('rounds', 'players', 'hands'))
+
+        dealer, deck = round_info['dealer'], round_info['deck']
+        rounds['round_number'].append(round_number)
+        rounds['dealer_cards'].append(', '.join(dealer['cards']))
+        rounds['dealer_value'].append(dealer['value'])
+        rounds['dealer_bust'].append(dealer['is_bust'])
+        rounds['cards_remaining'].append(deck['cards_remaining'])
+        rounds['cards_total_value'].append(deck['cards_total_value'])
+        rounds['running_count'].append(deck['cards_running_count'])
+        rounds['true_count'].append(deck['cards_true_count'])
+
+        for player in round_info['players']:
+            players['round_number'].append(round_number)
+            players['player'].append(player['name'])
+            players['budget'].append(player['budget'])
+
+            for hand_index, hand in enumerate(player['hands']):
+                hands['round_number'].append(round_number)
+                hands['player'].append(player['name'])
+                hands['hand_index'].append(hand_index)
+                hands['cards'].append(', '.join(hand['cards']))
+                hands['decisions'].append(','.join(
+                    decision[0] if isinstance(decision, tuple) else decision
+                    for decision in hand['decisions']
+                ))
+                hands['bet'].append(hand['bet'])
+                hands['value'].append(hand['cards value'])
+                hands['is_blackjack'].append(hand['is blackjack'])
+                hands['is_double_down'].append(hand['is double down'])
+                hands['is_ace_split'].append(hand['is ace split'])
+                hands['is_bust'].append(hand['is bust'])
+                hands['result'].append(str(hand['result']))
+
+        self.num_rounds += 1
+
+    def to_arrays(self):
+        """Returns the buffered rows as typed numpy columns, per table."""
+        return {
+            table: {
+                name: np.asarray(self.columns[table][name], dtype=dtype)
+                for name, dtype in schema.items()
+            }
+            for table, schema in TABLE_SCHEMAS.items()
+        }
+
+
+def round_info_from_tables(tables):
+    """Rebuilds nested round records from flat round/player/hand columns."""
+    rounds, players, hands = (tables[t] for t in ('rounds', 'players', 'hands'))
+    player_row = 0
+    hand_row = 0
+    num_players = len(players['round_number'])
+    num_hands = len(hands['round_number'])
+
+    for i, round_number in enumerate(rounds['round_number']):
+        round_players = []
+        while player_row < num_players and players['round_number'][player_row] == round_number:
+            name = str(players['player'][player_row])
+            player_hands = []
+            while (hand_row < num_hands and hands['round_number'][hand_row] == round_number
+                   and hands['player'][hand_row] == name):
+                player_hands.append({
+                    'cards': str(hands['cards'][hand_row]).split(', '),
+                    'decisions': [d for d in str(hands['decisions'][hand_row]).split(',') if d],
+                    'bet': float(hands['bet'][hand_row]),
+                    'cards value': int(hands['value'][hand_row]),
+                    'is blackjack': bool(hands['is_blackjack'][hand_row]),
+                    'is double down': bool(hands['is_double_down'][hand_row]),
+                    'is ace split': bool(hands['is_ace_split'][hand_row]),
+                    'is bust': bool(hands['is_bust'][hand_row]),
+                    'result': str(hands['result'][hand_row]),
+                })
+                hand_row += 1
+            round_players.append({
+                'name': name,
+                'budget': float(players['budget'][player_row]),
+                'hands': player_hands,
+            })
+            player_row += 1
+
+        yield {
+            'round number': int(round_number),
+            'players': round_players,
+            'dealer': {
+                'cards': str(rounds['dealer_cards'][i]).split(', '),
+                'value': int(rounds['dealer_value'][i]),
+                'is_bust': bool(rounds['dealer_bust'][i]),
+            },
+            'deck': {
+                'cards_remaining': int(rounds['cards_remaining'][i]),
+                'cards_total_value': int(rounds['cards_total_value'][i]),
+                'cards_running_count': int(rounds['running_count'][i]),
+                'cards_true_count': int(rounds['true_count'][i]),
+            },
+        }
+
+
+class RecordSink:
+    """Receives a record of every round a Game plays.
+
+    Every sink except NullSink feeds an OnlineAggregator, from which the
+    reports are served without rescanning the rounds.
+    """
+
+    keeps_rounds = False  # True if iter_round_info() can replay the rounds
+
+    def __init__(self):
+        self.rounds = 0
+        self.aggregator = OnlineAggregator()
+
+    def record(self, game):
+        """Records the round the game just played."""
+        self.rounds += 1
+        self.aggregator.update(game)
+
+    def flush(self):
+        """Writes out any buffered records."""
+        pass
+
+    def iter_round_info(self):
+        """Yields nested round records in the order they were played."""
+        raise ValueError(f"{type(self).__name__} does not keep per-round records")
+
+    def iter_tables(self):
+        """Yields the recorded rounds as flat ``{table: {column: array}}`` chunks."""
+        raise ValueError(f"{type(self).__name__} does not keep per-round records")
+
+
+class NullSink(RecordSink):
+    """Discards every record; only the round count is kept."""
+
+    def __init__(self):
+        super().__init__()
+        self.aggregator = None
+
+    def record(self, game):
+        self.rounds += 1
+
+
+class InMemorySink(RecordSink):
+    """Keeps every round as a nested dictionary in ``round_info_list``."""
+
+    keeps_rounds = True
+
+    def __init__(self):
+        super().__init__()
+        self.round_info_list = []
+
+    def record(self, game):
+        super().record(game)
+        self.round_info_list.append(build_round_info(game))
+
+    def iter_round_info(self):
+        return iter(self.round_info_list)
+
+    def iter_tables(self):
+        tables = ColumnTables()
+        for round_info in self.round_info_list:
+            tables.append_round_info(round_info)
+        yield tables.to_arrays()
+
+
+class ColumnarSink(RecordSink):
+    """Keeps every round as flat, typed columns in memory, without nested records."""
+
+    keeps_rounds = True
+
+    def __init__(self):
+        super().__init__()
+        self.tables = ColumnTables()
+
+    def record(self, game):
+        super().record(game)
+        self.tables.append(game)
+
+    def iter_tables(self):
+        yield self.tables.to_arrays()
+
+    def iter_round_info(self):
+        return round_info_from_tables(self.tables.to_arrays())
+
+
+class AggregateSink(RecordSink):
+    """Keeps only the per-player running statistics and budget history."""
+
+
+class ChunkedFileSink(RecordSink):
+    """Buffers rounds as flat columns and writes them to disk every ``chunk_rounds`` rounds.
+
+    Each flush writes ``<table>_<chunk>.npz`` for the rounds, players and
+    hands tables into ``output_dir``, so memory use stays bounded by one
+    chunk regardless of run length.
+    """
+
+    keeps_rounds = True
+
+    def __init__(self, output_dir, chunk_rounds=10_000):
+        super().__init__()
+        self.output_dir = output_dir
+        self.chunk_rounds = chunk_rounds
+        self.num_chunks = 0
+        self._tables = ColumnTables()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def record(self, game):
+        super().record(game)
+        self._tables.append(game)
+        if self._tables.num_rounds >= self.chunk_rounds:
+            self.flush()
+
+    def flush(self):
+        if not self._tables.num_rounds:
+            return
+        for table, columns in self._tables.to_arrays().items():
+            np.savez(self._chunk_path(table, self.num_chunks), **columns)
+        self.num_chunks += 1
+        self._tables.clear()
+
+    def _chunk_path(self, table, index):
+        return os.path.join(self.output_dir, f"{table}_{index:05d}.npz")
+
+    def iter_tables(self):
+        """Yields the written chunks, one at a time."""
+        self.flush()
+        for index in range(self.num_chunks):
+            chunk = {}
+            for table in TABLE_SCHEMAS:
+                with np.load(self._chunk_path(table, index)) as data:
+                    chunk[table] = {name: data[name] for name in data.files}
+            yield chunk
+
+    def iter_round_info(self):
+        for chunk in self.iter_tables():
+            yield from round_info_from_tables(chunk)
+
+
+def create_sink(kind, output_dir=None, chunk_rounds=10_000):
+    """Builds a record sink by name: ``memory``, ``columnar``, ``none``, ``aggregate`` or ``chunked``."""
+    if kind == 'memory':
+        return InMemorySink()
+    elif kind == 'columnar':
+        return ColumnarSink()
+    elif kind == 'none':
+        return NullSink()
+    elif kind == 'aggregate':
+        return AggregateSink()
+    elif kind == 'chunked':
+        return ChunkedFileSink(os.path.join(output_dir, 'rounds'), chunk_rounds)
+    raise ValueError(f"Unknown record sink: {kind}")
@@ -0,0 +1,356 @@
+import math
+from functools import lru_cache
+
+from ..game.card import CARD_VALUES, RANKS
+from ..game.dealer_odds import NUM_VALUES, DealerOdds, full_shoe
+
+# Pairs by value, soft totals 13-21 and hard totals 5-19
+NUM_HAND_CLASSES = NUM_VALUES + 9 + 15
+NUM_STRATA = NUM_HAND_CLASSES * NUM_VALUES
+# Strata with fewer rounds are pooled into one
+MIN_STRATUM_ROUNDS = 20
+ACE = RANKS.index('Ace')
+
+
+def hand_class(first, second):
+    """Returns the class of a starting hand from its two card values: a pair, a soft total or a hard total."""
+    if first == second:
+        return first - 2
+    if first == 11 or second == 11:
+        return NUM_VALUES + first + second - 13
+    return NUM_VALUES + 9 + first + second - 5
+
+
+def stratum(first, second, up_card):
+    """Returns the index of a starting hand class and up card."""
+    return hand_class(first, second) * NUM_VALUES + up_card - 2
+
+
+@lru_cache(maxsize=None)
+def stratum_weights(num_decks):
+    """Returns the exact probability of every stratum for a seat dealt from a full shoe."""
+    counts = full_shoe(num_decks)
+    total = sum(counts)
+    denominator = total * (total - 1) * (total - 2)
+    weights = [0.0] * NUM_STRATA
+    for first in range(2, 12):
+        for second in range(2, 12):
+            for up_card in range(2, 12):
+                ways = (
+                    counts[first - 2]
+                    * (counts[second - 2] - (second == first))
+                    * (counts[up_card - 2] - (up_card == first) - (up_card == second))
+                )
+                weights[stratum(first, second, up_card)] += ways / denominator
+    return tuple(weights)
+
+
+@lru_cache(maxsize=None)
+def bust_probabilities(num_decks):
+    """Returns the full-shoe dealer bust probability, indexed by up card value."""
+    odds = DealerOdds(num_decks=num_decks)
+    return (0.0, 0.0) + tuple(odds.bust_probability(up_card) for up_card in range(2, 12))
+
+
+class Moments:
+    """Running means and co-moments of a fixed-length vector (Welford)."""
+
+    __slots__ = ('n', 'mean', 'comoment')
+
+    def __init__(self, size):
+        self.n = 0
+        self.mean = [0.0] * size
+        self.comoment = [[0.0] * size for _ in range(size)]
+
+    def add(self, values):
+        self.n += 1
+        deltas = [value - mean for value, mean in zip(values, self.mean)]
+        self.mean = [mean + delta / self.n for mean, delta in zip(self.mean, deltas)]
+        for row, delta in zip(self.comoment, deltas):
+            for j, value in enumerate(values):
+                row[j] += delta * (value - self.mean[j])
+
+    def covariance(self, i, j):
+        """Sample covariance of components ``i`` and ``j``."""
+        return self.comoment[i][j] / (self.n - 1) if self.n > 1 else 0.0
+
+
+class RatioUnits:
+    """Sums of (net, rounds) over independent units, such as shoes, for a ratio estimate of net per round."""
+
+    __slots__ = ('k', 'net', 'rounds', 'net_sq', 'rounds_sq', 'cross')
+
+    def __init__(self):
+        self.k = 0
+        self.net = self.rounds = self.net_sq = self.rounds_sq = self.cross = 0.0
+
+    def add(self, net, rounds):
+        self.k += 1
+        self.net += net
+        self.rounds += rounds
+        self.net_sq += net * net
+        self.rounds_sq += rounds * rounds
+        self.cross += net * rounds
+
+    def mean(self):
+        return self.net / self.rounds if self.rounds else 0.0
+
+    def variance(self):
+        """Variance of the ratio estimate, by the delta method; None with fewer than two units."""
+        if self.k < 2 or not self.rounds:
+            return None
+        mu = self.mean()
+        residual = (self.net_sq - 2 * mu * self.cross + mu * mu * self.rounds_sq) / (self.k - 1)
+        return residual / (self.k * (self.rounds / self.k) ** 2)
+
+
+def _estimate(mean, variance, baseline_variance, rounds):
+    """Describes an estimator; ``gain`` is how many times fewer rounds it needs than the baseline."""
+    gain = baseline_variance / variance if variance and variance > 0 else None
+    return {
+        'mean': mean,
+        'std_error': math.sqrt(max(variance, 0.0)),
+        'gain': gain,
+        'effective_rounds': rounds * gain if gain is not None else None,
+    }
+
+
+class PlayerEstimates:
+    """Per-round net results of one player, with everything the estimators need."""
+
+    def __init__(self, antithetic=False):
+        self.antithetic = antithetic
+        # Net result, blackjack and dealer-bust control residuals
+        self.moments = Moments(3)
+        self.strata_n = [0] * NUM_STRATA
+        self.strata_mean = [0.0] * NUM_STRATA
+        self.strata_m2 = [0.0] * NUM_STRATA
+        self.shoe = None
+        self.shoe_net = 0.0
+        self.shoe_rounds = 0
+        self.shoes = RatioUnits()
+        self.pairs = RatioUnits()
+        self._first_of_pair = None
+
+    def add(self, net, blackjack_residual, bust_residual, hand_class, shoe):
+        self.moments.add((net, blackjack_residual, bust_residual))
+
+        n = self.strata_n[hand_class] = self.strata_n[hand_class] + 1
+        delta = net - self.strata_mean[hand_class]
+        self.strata_mean[hand_class] += delta / n
+        self.strata_m2[hand_class] += delta * (net - self.strata_mean[hand_class])
+
+        if shoe != self.shoe:
+            self._close_shoe()
+            self.shoe = shoe
+        self.shoe_net += net
+        self.shoe_rounds += 1
+
+    def _close_shoe(self):
+        if not self.shoe_rounds:
+            return
+        if not self.antithetic:
+            self.shoes.add(self.shoe_net, self.shoe_rounds)
+        elif self.shoe % 2 == 0:
+            self._first_of_pair = (self.shoe, self.shoe_net, self.shoe_rounds)
+        elif self._first_of_pair is not None and self._first_of_pair[0] == self.shoe - 1:
+            _, first_net, first_rounds = self._first_of_pair
+            # Only shoes of complete pairs, so both estimates cover the same rounds
+            self.shoes.add(first_net, first_rounds)
+            self.shoes.add(self.shoe_net, self.shoe_rounds)
+            self.pairs.add(first_net + self.shoe_net, first_rounds + self.shoe_rounds)
+            self._first_of_pair = None
+        self.shoe_net = 0.0
+        self.shoe_rounds = 0
+
+    def summary(self, weights):
+        """Returns the plain mean net result per round and every variance-reduced estimate of it."""
+        moments = self.moments
+        n = moments.n
+        variance = moments.covariance(0, 0)
+        plain_variance = variance / n if n else 0.0
+        summary = {
+            'rounds': n,
+            'mean': moments.mean[0],
+            'std_error': math.sqrt(plain_variance),
+            'estimators': {},
+        }
+        if n < 2:
+            return summary
+        estimators = summary['estimators']
+
+        # Control variates: regress the net result on both residuals, whose expectation is 0
+        c11, c12, c22 = moments.covariance(1, 1), moments.covariance(1, 2), moments.covariance(2, 2)
+        determinant = c11 * c22 - c12 * c12
+        if determinant > 0:
+            cy1, cy2 = moments.covariance(0, 1), moments.covariance(0, 2)
+            beta = ((c22 * cy1 - c12 * cy2) / determinant, (c11 * cy2 - c12 * cy1) / determinant)
+            mean = moments.mean[0] - beta[0] * moments.mean[1] - beta[1] * moments.mean[2]
+            residual = variance - beta[0] * cy1 - beta[1] * cy2
+            estimators['control_variates'] = _estimate(mean, residual / n, plain_variance, n)
+            estimators['control_variates']['beta'] = beta
+
+        # Post-stratification on the starting hand class and up card with exact full-shoe
+        # weights; sparse strata are pooled into one, so no weight is dropped while it has rounds
+        mean = stratified_variance = 0.0
+        pooled = 0
+        pool_n = pool_mean = pool_m2 = pool_weight = 0.0
+        for h in range(NUM_STRATA):
+            n_h = self.strata_n[h]
+            if n_h >= MIN_STRATUM_ROUNDS:
+                mean += weights[h] * self.strata_mean[h]
+                stratified_variance += weights[h] ** 2 * self.strata_m2[h] / (n_h - 1) / n_h
+                continue
+            pooled += 1
+            pool_weight += weights[h]
+            if n_h:
+                combined = pool_n + n_h
+                delta = self.strata_mean[h] - pool_mean
+                pool_m2 += self.strata_m2[h] + delta * delta * pool_n * n_h / combined
+                pool_mean += delta * n_h / combined
+                pool_n = combined
+        if pool_n > 1:
+            mean += pool_weight * pool_mean
+            stratified_variance += pool_weight ** 2 * pool_m2 / (pool_n - 1) / pool_n
+            missing_weight = 0.0
+        else:
+            missing_weight = pool_weight
+        if missing_weight < 1:
+            covered = 1 - missing_weight
+            estimators['stratified'] = _estimate(
+                mean / covered, stratified_variance / covered ** 2, plain_variance, n
+            )
+            estimators['stratified']['pooled_strata'] = pooled
+            estimators['stratified']['missing_weight'] = missing_weight
+
+        # Antithetic shoe pairs, against treating the same shoes as independent
+        pair_variance = self.pairs.variance()
+        shoe_variance = self.shoes.variance()
+        if pair_variance is not None and shoe_variance is not None:
+            estimators['antithetic'] = _estimate(
+                self.pairs.mean(), pair_variance, shoe_variance, int(self.pairs.rounds)
+            )
+        return summary
+
+
+class VarianceEstimators:
+    """Variance-reduced estimates of each player's net result per round, computed as the game runs.
+
+    Fed once per round through ``OnlineAggregator.estimators``. Each estimator
+    reports its ``gain``: the factor by which its variance is smaller than
+    the plain mean's, i.e. how many times fewer rounds it needs for the same
+    precision.
+
+    - Control variates use two residuals with expectation 0. The first is
+      whether the seat was dealt a blackjack, minus its exact probability
+      for the shoe as it stood before the deal. The second is whether the
+      dealer busted, minus the full-shoe bust probability for the up card;
+      removal effects leave that one off zero only to second order.
+    - Stratification post-stratifies on the seat's starting hand (pair,
+      soft or hard total) and the up card, weighted by their exact
+      full-shoe probabilities. Strata with fewer than
+      ``MIN_STRATUM_ROUNDS`` rounds are pooled into one stratum; the report
+      flags how many were, and any weight left without rounds.
+    - Antithetic estimates need a deck with ``antithetic=True`` and use
+      mirrored shoe pairs as units; their gain is measured against the same
+      shoes taken as independent units.
+    - Common random numbers: every pair of players at the table shares the
+      dealer's cards, so their paired difference is compared with the
+      difference of two independent runs.
+    """
+
+    def __init__(self, game):
+        num_decks = game.deck.num_decks
+        self.weights = stratum_weights(num_decks)
+        self.bust = bust_probabilities(num_decks)
+        composition = full_shoe(num_decks)
+        self._full_shoe = (composition[-1], composition[-2], sum(composition))  # aces, tens, cards
+        self.players = {player.name: PlayerEstimates(game.deck.antithetic) for player in game.players}
+        self._budgets = {player.name: player.budget for player in game.players}
+        names = list(self.players)
+        self.differences = {
+            (first, second): Moments(1) for i, first in enumerate(names) for second in names[i + 1:]
+        }
+
+    def update(self, game):
+        """Adds the round the game just played."""
+        deck = game.deck
+        dealer_hand = game.dealer.hand
+        # The shoe before the deal is what's left plus everything on the table
+        table = list(dealer_hand.cards)
+        for player in game.players:
+            for hand in player.hands:
+                table.extend(hand.cards)
+        if deck.position >= len(table):
+            ranks = deck.rank_counts
+            aces = ranks[ACE] + sum(1 for card in table if card >> 2 == ACE)
+            tens = sum(ranks[8:12]) + sum(1 for card in table if CARD_VALUES[card] == 10)
+            cards = deck.cards_remaining() + len(table)
+            shoe = deck.shoes_dealt - 1
+        else:
+            # The shoe ran out mid-round: the round started on the previous shoe
+            aces, tens, cards = self._full_shoe
+            shoe = deck.shoes_dealt - 2
+        blackjack_probability = 2 * aces * tens / (cards * (cards - 1))
+        up_card = game.dealer.up_card_value()
+        bust_residual = dealer_hand.is_bust() - self.bust[up_card]
+
+        nets = {}
+        for player in game.players:
+            net = player.budget - self._budgets[player.name]
+            self._budgets[player.name] = player.budget
+            hands = player.hands
+            if not hands:
+                continue
+            nets[player.name] = net
+            first = CARD_VALUES[hands[0].cards[0]]
+            # A split moves the second card to the second hand; both have the same value
+            second = first if len(hands) > 1 else CARD_VALUES[hands[0].cards[1]]
+            self.players[player.name].add(
+                net, (first + second == 21) - blackjack_probability, bust_residual,
+                stratum(first, second, up_card), shoe,
+            )
+
+        for (first, second), moments in self.differences.items():
+            if first in nets and second in nets:
+                moments.add((nets[first] - nets[second],))
+
+    def summary(self):
+        """Returns per-player estimates and per-pair common-random-number differences."""
+        players = {name: estimates.summary(self.weights) for name, estimates in self.players.items()}
+        pairs = {}
+        for (first, second), moments in self.differences.items():
+            if moments.n < 2:
+                continue
+            a, b = players[first], players[second]
+            independent = a['std_error'] ** 2 + b['std_error'] ** 2
+            pairs[f"{first} vs {second}"] = _estimate(
+                moments.mean[0], moments.covariance(0, 0) / moments.n, independent, moments.n
+            )
+        return {'players': players, 'common_random_numbers': pairs}
+
+    def report(self):
+        """Returns the summary as plain text."""
+        summary = self.summary()
+        lines = ["Variance reduction (net result per round)", "=========================================="]
+        for name, player in summary['players'].items():
+            lines.append(f"\n{name}: {player['mean']:+.4f} ± {player['std_error']:.4f} "
+                         f"over {player['rounds']} rounds (plain mean)")
+            for estimator, estimate in player['estimators'].items():
+                lines.append(_format_estimate(estimator, estimate))
+                if estimate.get('pooled_strata'):
+                    note = f"    {estimate['pooled_strata']} of {NUM_STRATA} strata pooled"
+                    if estimate['missing_weight']:
+                        note += f", {estimate['missing_weight']:.2%} of the weight has no rounds (biased)"
+                    lines.append(note)
+        if summary['common_random_numbers']:
+            lines.append("\nPaired differences (common random numbers):")
+            for pair, estimate in summary['common_random_numbers'].items():
+                lines.append(_format_estimate(pair, estimate))
+        return "\n".join(lines)
+
+
+def _format_estimate(label, estimate):
+    gain = estimate['gain']
+    gain_text = f"gain {gain:.2f}x, {estimate['effective_rounds']:.0f} effective rounds" if gain else "gain n/a"
+    return f"  {label:<24} {estimate['mean']:+.4f} ± {estimate['std_error']:.4f}  ({gain_text})"
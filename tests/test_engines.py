@@ -0,0 +1,62 @@
+import math
+from itertools import combinations_with_replacement
+
+import pytest
+
+from src.game.blackjack import Game
+from src.game.card import CARD_VALUES
+from src.game.hand import Hand
+from src.game.player import Player
+from src.game.vectorized import VectorizedSimulator
+from src.strategies.decision_table import ACTIONS
+from src.strategies.optimal_strategy import OptimalStrategy
+from src.utils.sinks import NullSink
+
+BUDGET = 10 ** 9  # Every split or double down is affordable, as in VectorizedSimulator
+
+
+@pytest.fixture(scope="module")
+def strategy(tmp_path_factory):
+    return OptimalStrategy(table_path=tmp_path_factory.mktemp("tables") / "optimal.npy")
+
+
+def _hand(values):
+    hand = Hand()
+    hand.bet = 10
+    for value in values:
+        hand.add_card(CARD_VALUES.index(value))
+    return hand
+
+
+def test_game_decisions_match_the_table_the_vectorized_engine_reads(strategy):
+    player = Player("Optimal", BUDGET, strategy)
+    game = Game([player], seed=1, sink=NullSink())
+    actions = strategy.table.actions[1]
+    for num_cards in (2, 3):
+        for values in combinations_with_replacement(range(2, 12), num_cards):
+            hand = _hand(values)
+            if hand.is_bust():
+                continue
+            player.hands = [hand]
+            pair_value = CARD_VALUES[hand.cards[0]] if hand.can_split() else 0
+            for up_card in range(2, 12):
+                game.dealer.reset_hand()
+                game.dealer.hand.add_card(CARD_VALUES.index(up_card))
+                game.dealer.hand.add_card(CARD_VALUES.index(10))
+                decision, _ = strategy.decide(hand, game, player.budget)
+                expected = actions[pair_value, int(hand.is_soft), min(hand.get_value(), 21), up_card]
+                assert decision == ACTIONS[expected], (values, up_card)
+
+
+def test_game_and_vectorized_house_edges_agree(strategy):
+    num_rounds = 300_000
+    player = Player("Optimal", BUDGET, strategy)
+    game = Game([player], seed=7, sink=NullSink())
+    game.run_simulation(num_rounds)
+    game_edge = (BUDGET - player.budget) / (game.minimum_bet * num_rounds)
+
+    vectorized = VectorizedSimulator(strategy.table).run(4 * num_rounds, seed=7)
+    low, high = vectorized['house_edge_ci']
+    # Both standard errors come from the vectorized run's per-round variance
+    stderr = (high - low) / (2 * 1.96) * math.sqrt(4 + 1)
+    assert abs(game_edge - vectorized['house_edge']) < 4 * stderr
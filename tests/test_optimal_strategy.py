@@ -0,0 +1,36 @@
+import json
+
+import numpy as np
+
+from src.strategies import optimal_strategy
+from src.strategies.decision_table import DecisionTable
+from src.strategies.optimal_strategy import OptimalStrategy, table_rules
+
+
+def _load(path):
+    optimal_strategy._strategy_table.cache_clear()
+    return OptimalStrategy(table_path=path).table.actions
+
+
+def test_table_is_saved_with_its_rules(tmp_path):
+    path = tmp_path / "optimal.npz"
+    actions = _load(path)
+    with np.load(path) as saved:
+        assert json.loads(str(saved['rules'])) == table_rules(6)
+        assert np.array_equal(saved['actions'], actions)
+
+
+def test_table_solved_for_other_rules_is_solved_again(tmp_path):
+    path = tmp_path / "optimal.npz"
+    solved = _load(path)
+    stale = dict(table_rules(6), solver_version=0)
+    with open(path, 'wb') as f:
+        np.savez(f, actions=np.zeros(DecisionTable.SHAPE, dtype=np.uint8), rules=json.dumps(stale))
+    assert np.array_equal(_load(path), solved)
+
+
+def test_unversioned_table_is_solved_again(tmp_path):
+    path = tmp_path / "optimal.npy"
+    with open(path, 'wb') as f:
+        np.save(f, np.zeros(DecisionTable.SHAPE, dtype=np.uint8))
+    assert _load(path).any()
@@ -0,0 +1,42 @@
+import copy
+
+import yaml
+
+from src.game.blackjack import create_game
+
+CONFIG = """
+game:
+  minimum_bet: 10
+  num_decks: 6
+simulation:
+  num_rounds: 20000
+  verbose: false
+  output_dir: results
+  record_sink: none
+  outcome_cache:
+    min_samples: 20
+players:
+  - name: Basic
+    initial_budget: 1000000
+    strategy: BasicStrategy
+strategies: {}
+"""
+
+
+def _budgets(config, seed):
+    game = create_game(config, seed=seed)
+    game.run_simulation(config['simulation']['num_rounds'])
+    assert game.outcome_cache.rounds_answered
+    return [player.budget for player in game.players]
+
+
+def test_seeded_runs_with_the_cache_are_reproducible():
+    config = yaml.safe_load(CONFIG)
+    assert _budgets(copy.deepcopy(config), 42) == _budgets(copy.deepcopy(config), 42)
+
+
+def test_cache_seed_in_the_config_takes_precedence():
+    config = yaml.safe_load(CONFIG)
+    config['simulation']['outcome_cache']['seed'] = 7
+    game = create_game(config, seed=42)
+    assert game.outcome_cache.rng.random() == create_game(config, seed=1).outcome_cache.rng.random()
@@ -0,0 +1,23 @@
+from src.game.sweep import config_hash
+
+CONFIG = {
+    'game': {'minimum_bet': 10},
+    'simulation': {'num_rounds': 1000, 'verbose': False, 'output_dir': 'results'},
+    'players': [{'name': 'Basic', 'initial_budget': 1000, 'strategy': 'BasicStrategy'}],
+    'strategies': {},
+}
+
+
+def _with_simulation(**settings):
+    return {**CONFIG, 'simulation': {**CONFIG['simulation'], **settings}}
+
+
+def test_config_hash_depends_on_result_changing_simulation_settings():
+    assert config_hash(_with_simulation(outcome_cache={'min_samples': 50}), 1000, 1) != config_hash(CONFIG, 1000, 1)
+    assert config_hash(_with_simulation(adaptive={'target_ci': 0.01}), 1000, 1) != config_hash(CONFIG, 1000, 1)
+
+
+def test_config_hash_ignores_result_neutral_settings():
+    neutral = _with_simulation(verbose=True, output_dir='elsewhere', num_rounds=5, record_sink='none')
+    assert config_hash(neutral, 1000, 1) == config_hash(CONFIG, 1000, 1)
+    assert config_hash({**CONFIG, 'sweep': {'grid': {}}}, 1000, 1) == config_hash(CONFIG, 1000, 1)